@@ -1,14 +1,60 @@
 import os
 import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
 
 random.seed(42)
 
+# Benchmark BST simples x AVL. A BST simples com chaves ordenadas vira uma lista
+# ligada (O(n^2) para montar e recursao com profundidade n), entao nesse caso o
+# tamanho fica limitado a BST_SORTED_LIMIT.
+BENCHMARK_SIZES = [100000, 1000000]
+BST_SORTED_LIMIT = 5000
+# Entrada com muitas chaves repetidas: so BENCHMARK_DISTINCT valores distintos. Na
+# BST simples cada repetido desce pela direita dos iguais, entao ela tambem fica
+# limitada a BST_SORTED_LIMIT.
+BENCHMARK_DISTINCT = 10
+
+# Cada no guarda a propria altura e se a sua subarvore esta balanceada; inserir e
+# deletar atualizam esses campos na volta da recursao, entao altura(raiz) e
+# esta_balanceada(raiz) viram O(1). Desligado, as consultas usam analisar_arvore.
+USAR_CACHE_ALTURA = True
+
+# Comparacao de memoria por no e buscas por segundo entre as representacoes.
+MEMORY_BENCHMARK_SIZE = 100000
+
 
 class BSTNode:
+    # __slots__ elimina o __dict__ de cada instancia (bem menos bytes por no).
+    __slots__ = ("valor", "esquerda", "direita", "altura", "balanceada")
+
     def __init__(self, valor):
         self.valor = valor
         self.esquerda = None
         self.direita = None
+        self.altura = 1
+        self.balanceada = True
+
+
+def altura_no(no):
+    if no is None:
+        return 0
+    return no.altura
+
+
+def atualizar_cache(no):
+    # Recalcula altura e balanceamento do no a partir dos filhos, em O(1).
+    altura_esquerda = altura_no(no.esquerda)
+    altura_direita = altura_no(no.direita)
+    no.altura = 1 + max(altura_esquerda, altura_direita)
+    no.balanceada = (
+        abs(altura_esquerda - altura_direita) <= 1
+        and (no.esquerda is None or no.esquerda.balanceada)
+        and (no.direita is None or no.direita.balanceada)
+    )
 
 
 def inserir(raiz, valor):
@@ -19,70 +65,134 @@ def inserir(raiz, valor):
         raiz.esquerda = inserir(raiz.esquerda, valor)
     else:
         raiz.direita = inserir(raiz.direita, valor)
+    if USAR_CACHE_ALTURA:
+        atualizar_cache(raiz)
     return raiz
 
 
+def analisar_arvore(raiz):
+    # Percurso pos-ordem iterativo que devolve (altura, balanceada, tamanho) numa
+    # unica passada O(n), sem recursao e sem depender dos campos em cache.
+    pilha = [(raiz, False)]
+    resultados = []
+    while pilha:
+        no, filhos_prontos = pilha.pop()
+        if no is None:
+            resultados.append((0, True, 0))
+        elif filhos_prontos:
+            altura_direita, balanceada_direita, tamanho_direita = resultados.pop()
+            altura_esquerda, balanceada_esquerda, tamanho_esquerda = resultados.pop()
+            resultados.append(
+                (
+                    1 + max(altura_esquerda, altura_direita),
+                    balanceada_esquerda
+                    and balanceada_direita
+                    and abs(altura_esquerda - altura_direita) <= 1,
+                    1 + tamanho_esquerda + tamanho_direita,
+                )
+            )
+        else:
+            pilha.append((no, True))
+            pilha.append((no.direita, False))
+            pilha.append((no.esquerda, False))
+    return resultados[0]
+
+
 def altura(raiz):
     # Exercicio 3c: calcular altura da arvore.
     if raiz is None:
         return 0
-    altura_esquerda = altura(raiz.esquerda)
-    altura_direita = altura(raiz.direita)
-    return 1 + max(altura_esquerda, altura_direita)
+    if USAR_CACHE_ALTURA:
+        return raiz.altura
+    return analisar_arvore(raiz)[0]
 
 
 def esta_balanceada(raiz):
     # Exercicio 3c: verificar se a arvore esta balanceada.
     if raiz is None:
         return True
-    altura_esquerda = altura(raiz.esquerda)
-    altura_direita = altura(raiz.direita)
-    if abs(altura_esquerda - altura_direita) > 1:
-        return False
-    return esta_balanceada(raiz.esquerda) and esta_balanceada(raiz.direita)
+    if USAR_CACHE_ALTURA:
+        return raiz.balanceada
+    return analisar_arvore(raiz)[1]
+
+
+def tamanho(raiz):
+    return analisar_arvore(raiz)[2]
+
+
+def iterar_pre_ordem(raiz):
+    # Gerador pre-ordem com pilha explicita: memoria extra O(altura).
+    pilha = [raiz] if raiz is not None else []
+    while pilha:
+        no = pilha.pop()
+        yield no.valor
+        if no.direita is not None:
+            pilha.append(no.direita)
+        if no.esquerda is not None:
+            pilha.append(no.esquerda)
+
+
+def iterar_em_ordem(raiz):
+    # Gerador em ordem: desce pela esquerda empilhando o caminho.
+    pilha = []
+    atual = raiz
+    while pilha or atual is not None:
+        while atual is not None:
+            pilha.append(atual)
+            atual = atual.esquerda
+        atual = pilha.pop()
+        yield atual.valor
+        atual = atual.direita
+
+
+def iterar_pos_ordem(raiz):
+    # Gerador pos-ordem com uma pilha so: o no sai quando a direita ja foi visitada.
+    pilha = []
+    atual = raiz
+    ultimo_visitado = None
+    while pilha or atual is not None:
+        while atual is not None:
+            pilha.append(atual)
+            atual = atual.esquerda
+        topo = pilha[-1]
+        if topo.direita is not None and topo.direita is not ultimo_visitado:
+            atual = topo.direita
+        else:
+            pilha.pop()
+            yield topo.valor
+            ultimo_visitado = topo
+
+
+def iterar_em_nivel(raiz):
+    # Gerador em nivel com deque: popleft e O(1), ao contrario de list.pop(0).
+    fila = deque([raiz]) if raiz is not None else deque()
+    while fila:
+        atual = fila.popleft()
+        yield atual.valor
+        if atual.esquerda is not None:
+            fila.append(atual.esquerda)
+        if atual.direita is not None:
+            fila.append(atual.direita)
 
 
 def percurso_pre_ordem(raiz, resultado):
     # Exercicio 3d-i: percurso pre-ordem.
-    if raiz is None:
-        return
-    resultado.append(raiz.valor)
-    percurso_pre_ordem(raiz.esquerda, resultado)
-    percurso_pre_ordem(raiz.direita, resultado)
+    resultado.extend(iterar_pre_ordem(raiz))
 
 
 def percurso_pos_ordem(raiz, resultado):
     # Exercicio 3d-ii: percurso pos-ordem.
-    if raiz is None:
-        return
-    percurso_pos_ordem(raiz.esquerda, resultado)
-    percurso_pos_ordem(raiz.direita, resultado)
-    resultado.append(raiz.valor)
+    resultado.extend(iterar_pos_ordem(raiz))
 
 
 def percurso_em_ordem(raiz, resultado):
     # Exercicio 3d-iii: percurso em ordem.
-    if raiz is None:
-        return
-    percurso_em_ordem(raiz.esquerda, resultado)
-    resultado.append(raiz.valor)
-    percurso_em_ordem(raiz.direita, resultado)
+    resultado.extend(iterar_em_ordem(raiz))
 
 
 def percurso_em_nivel(raiz):
-    # Exercicio 3d-iv: percurso em nivel usando lista como fila.
-    if raiz is None:
-        return []
-    fila = [raiz]
-    resultado = []
-    while len(fila) > 0:
-        atual = fila.pop(0)
-        resultado.append(atual.valor)
-        if atual.esquerda is not None:
-            fila.append(atual.esquerda)
-        if atual.direita is not None:
-            fila.append(atual.direita)
-    return resultado
+    # Exercicio 3d-iv: percurso em nivel usando deque como fila.
+    return list(iterar_em_nivel(raiz))
 
 
 def encontrar_minimo(raiz):
@@ -108,9 +218,373 @@ def deletar(raiz, valor):
         sucessor = encontrar_minimo(raiz.direita)
         raiz.valor = sucessor.valor
         raiz.direita = deletar(raiz.direita, sucessor.valor)
+    if USAR_CACHE_ALTURA:
+        atualizar_cache(raiz)
+    return raiz
+
+
+def buscar(raiz, valor):
+    # Busca iterativa, serve tanto para a BST simples quanto para a AVL.
+    atual = raiz
+    while atual is not None:
+        if valor == atual.valor:
+            return atual
+        if valor < atual.valor:
+            atual = atual.esquerda
+        else:
+            atual = atual.direita
+    return None
+
+
+class AVLNode(BSTNode):
+    # A AVL sempre mantem os campos em cache: as rotacoes dependem da altura.
+    __slots__ = ()
+
+
+def rotacionar_direita(no):
+    nova_raiz = no.esquerda
+    no.esquerda = nova_raiz.direita
+    nova_raiz.direita = no
+    atualizar_cache(no)
+    atualizar_cache(nova_raiz)
+    return nova_raiz
+
+
+def rotacionar_esquerda(no):
+    nova_raiz = no.direita
+    no.direita = nova_raiz.esquerda
+    nova_raiz.esquerda = no
+    atualizar_cache(no)
+    atualizar_cache(nova_raiz)
+    return nova_raiz
+
+
+def rebalancear_avl(no):
+    # Aplica a rotacao simples ou dupla quando a diferenca de alturas passa de 1.
+    atualizar_cache(no)
+    fator = altura_no(no.esquerda) - altura_no(no.direita)
+    if fator > 1:
+        if altura_no(no.esquerda.esquerda) < altura_no(no.esquerda.direita):
+            no.esquerda = rotacionar_esquerda(no.esquerda)
+        return rotacionar_direita(no)
+    if fator < -1:
+        if altura_no(no.direita.direita) < altura_no(no.direita.esquerda):
+            no.direita = rotacionar_direita(no.direita)
+        return rotacionar_esquerda(no)
+    return no
+
+
+def inserir_avl(raiz, valor):
+    # Mesma regra de inserir (repetidos vao para a direita), mas rebalanceando
+    # na volta da recursao: a altura fica O(log n) para qualquer ordem de entrada.
+    if raiz is None:
+        return AVLNode(valor)
+    if valor < raiz.valor:
+        raiz.esquerda = inserir_avl(raiz.esquerda, valor)
+    else:
+        raiz.direita = inserir_avl(raiz.direita, valor)
+    return rebalancear_avl(raiz)
+
+
+def deletar_avl(raiz, valor):
+    # Remocao com sucessor em ordem, como em deletar, rebalanceando cada ancestral.
+    if raiz is None:
+        return None
+    if valor < raiz.valor:
+        raiz.esquerda = deletar_avl(raiz.esquerda, valor)
+    elif valor > raiz.valor:
+        raiz.direita = deletar_avl(raiz.direita, valor)
+    else:
+        if raiz.esquerda is None:
+            return raiz.direita
+        if raiz.direita is None:
+            return raiz.esquerda
+        sucessor = encontrar_minimo(raiz.direita)
+        raiz.valor = sucessor.valor
+        raiz.direita = deletar_avl(raiz.direita, sucessor.valor)
+    return rebalancear_avl(raiz)
+
+
+class ArvoreArranjos:
+    # BST em struct-of-arrays: o no i e so um indice; os filhos ficam em
+    # array("i") (-1 = vazio) e os valores numa lista paralela. Nao ha um objeto
+    # Python por no, so 8 bytes de filhos mais a referencia ao valor. Indices
+    # liberados por deletar ficam em `livres` e sao reaproveitados por inserir.
+    def __init__(self):
+        self.valores = []
+        self.esquerda = array("i")
+        self.direita = array("i")
+        self.livres = []
+        self.raiz = -1
+
+    def __len__(self):
+        return len(self.valores) - len(self.livres)
+
+    def inserir(self, valor):
+        # Mesma regra de inserir: repetidos vao para a direita.
+        if self.livres:
+            novo = self.livres.pop()
+            self.valores[novo] = valor
+        else:
+            novo = len(self.valores)
+            self.valores.append(valor)
+            self.esquerda.append(-1)
+            self.direita.append(-1)
+        if self.raiz == -1:
+            self.raiz = novo
+            return
+        valores = self.valores
+        atual = self.raiz
+        while True:
+            if valor < valores[atual]:
+                if self.esquerda[atual] == -1:
+                    self.esquerda[atual] = novo
+                    return
+                atual = self.esquerda[atual]
+            else:
+                if self.direita[atual] == -1:
+                    self.direita[atual] = novo
+                    return
+                atual = self.direita[atual]
+
+    def buscar(self, valor):
+        # Devolve o indice do no com o valor ou None, como buscar devolve o no.
+        valores = self.valores
+        atual = self.raiz
+        while atual != -1:
+            if valor == valores[atual]:
+                return atual
+            if valor < valores[atual]:
+                atual = self.esquerda[atual]
+            else:
+                atual = self.direita[atual]
+        return None
+
+    def deletar(self, valor):
+        # Mesma regra de deletar: com dois filhos o no recebe o valor do sucessor
+        # e quem sai da arvore e o sucessor. Devolve False se o valor nao existe.
+        valores = self.valores
+        esquerda = self.esquerda
+        direita = self.direita
+        pai = -1
+        atual = self.raiz
+        while atual != -1 and valor != valores[atual]:
+            pai = atual
+            atual = esquerda[atual] if valor < valores[atual] else direita[atual]
+        if atual == -1:
+            return False
+        if esquerda[atual] != -1 and direita[atual] != -1:
+            pai = atual
+            sucessor = direita[atual]
+            while esquerda[sucessor] != -1:
+                pai = sucessor
+                sucessor = esquerda[sucessor]
+            valores[atual] = valores[sucessor]
+            atual = sucessor
+        filho = esquerda[atual] if esquerda[atual] != -1 else direita[atual]
+        if pai == -1:
+            self.raiz = filho
+        elif esquerda[pai] == atual:
+            esquerda[pai] = filho
+        else:
+            direita[pai] = filho
+        valores[atual] = None
+        esquerda[atual] = -1
+        direita[atual] = -1
+        self.livres.append(atual)
+        return True
+
+    def iterar_pre_ordem(self):
+        pilha = [self.raiz] if self.raiz != -1 else []
+        while pilha:
+            atual = pilha.pop()
+            yield self.valores[atual]
+            if self.direita[atual] != -1:
+                pilha.append(self.direita[atual])
+            if self.esquerda[atual] != -1:
+                pilha.append(self.esquerda[atual])
+
+    def iterar_em_ordem(self):
+        pilha = []
+        atual = self.raiz
+        while pilha or atual != -1:
+            while atual != -1:
+                pilha.append(atual)
+                atual = self.esquerda[atual]
+            atual = pilha.pop()
+            yield self.valores[atual]
+            atual = self.direita[atual]
+
+    def iterar_pos_ordem(self):
+        pilha = []
+        atual = self.raiz
+        ultimo_visitado = -1
+        while pilha or atual != -1:
+            while atual != -1:
+                pilha.append(atual)
+                atual = self.esquerda[atual]
+            topo = pilha[-1]
+            direita = self.direita[topo]
+            if direita != -1 and direita != ultimo_visitado:
+                atual = direita
+            else:
+                pilha.pop()
+                yield self.valores[topo]
+                ultimo_visitado = topo
+
+    def iterar_em_nivel(self):
+        fila = deque([self.raiz]) if self.raiz != -1 else deque()
+        while fila:
+            atual = fila.popleft()
+            yield self.valores[atual]
+            if self.esquerda[atual] != -1:
+                fila.append(self.esquerda[atual])
+            if self.direita[atual] != -1:
+                fila.append(self.direita[atual])
+
+
+class _NoComDict:
+    # Referencia para a medicao: o mesmo no de antes, sem __slots__.
+    def __init__(self, valor):
+        self.valor = valor
+        self.esquerda = None
+        self.direita = None
+
+
+def _inserir_no_com_dict(raiz, valor):
+    if raiz is None:
+        return _NoComDict(valor)
+    atual = raiz
+    while True:
+        lado = "esquerda" if valor < atual.valor else "direita"
+        filho = getattr(atual, lado)
+        if filho is None:
+            setattr(atual, lado, _NoComDict(valor))
+            return raiz
+        atual = filho
+
+
+def executar_benchmark_memoria():
+    # Bytes por no (tracemalloc, sem contar os valores) e buscas por segundo.
+    valores = random.sample(range(MEMORY_BENCHMARK_SIZE * 10), MEMORY_BENCHMARK_SIZE)
+
+    def montar_arranjos(lista):
+        arvore = ArvoreArranjos()
+        for valor in lista:
+            arvore.inserir(valor)
+        return arvore
+
+    representacoes = [
+        ("No com __dict__", lambda lista: inserir_varios(_inserir_no_com_dict, lista), buscar),
+        ("BSTNode com __slots__", lambda lista: inserir_varios(inserir, lista), buscar),
+        ("Struct-of-arrays", montar_arranjos, lambda arvore, valor: arvore.buscar(valor)),
+    ]
+    linhas = []
+    for nome, construir, funcao_buscar in representacoes:
+        tracemalloc.start()
+        estrutura = construir(valores)
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        inicio = time.perf_counter()
+        for valor in valores:
+            funcao_buscar(estrutura, valor)
+        duracao = time.perf_counter() - inicio
+        registro = (
+            f"{nome} | n={len(valores)} | bytes por no={memoria / len(valores):.1f} | "
+            f"buscas por segundo={len(valores) / duracao:,.0f}"
+        )
+        print(registro)
+        linhas.append(registro)
+    caminho = os.path.join("outputs", "bst_memoria.txt")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for linha in linhas:
+            arquivo.write(linha + "\n")
+    return caminho
+
+
+def construir_balanceada(valores, ordenados=False, classe_no=BSTNode):
+    # Carga em lote: ordena uma vez (ou aceita a entrada ja ordenada) e monta a
+    # arvore perfeitamente balanceada escolhendo o meio de cada intervalo, em
+    # O(n) depois da ordenacao. Os campos em cache ja saem preenchidos.
+    if not ordenados:
+        valores = sorted(valores)
+
+    def construir(inicio, fim):
+        if inicio > fim:
+            return None
+        # Sempre o meio exato, mesmo com repetidos: copias iguais podem ficar dos
+        # dois lados (buscar e deletar acham o valor em qualquer um), e a altura
+        # continua log2(n) em vez de virar uma lista ligada de repetidos.
+        meio = (inicio + fim) // 2
+        no = classe_no(valores[meio])
+        no.esquerda = construir(inicio, meio - 1)
+        no.direita = construir(meio + 1, fim)
+        atualizar_cache(no)
+        return no
+
+    return construir(0, len(valores) - 1)
+
+
+def rebalancear(raiz):
+    # Reconstroi uma arvore existente a partir do percurso em ordem (ja ordenado).
+    return construir_balanceada(list(iterar_em_ordem(raiz)), ordenados=True)
+
+
+def inserir_varios(funcao_inserir, valores):
+    raiz = None
+    for valor in valores:
+        raiz = funcao_inserir(raiz, valor)
     return raiz
 
 
+def medir_arvore(construir, valores):
+    # Monta a arvore com `construir` e depois busca todas as chaves.
+    inicio = time.perf_counter()
+    raiz = construir(valores)
+    tempo_insercao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for valor in valores:
+        buscar(raiz, valor)
+    tempo_busca = time.perf_counter() - inicio
+    return tempo_insercao, tempo_busca, altura(raiz)
+
+
+def executar_benchmark_balanceamento():
+    # BST simples x AVL x carga em lote com chaves aleatorias e ordenadas.
+    linhas = []
+    arvores = [
+        ("BST simples", lambda valores: inserir_varios(inserir, valores)),
+        ("AVL", lambda valores: inserir_varios(inserir_avl, valores)),
+        ("BST em lote", construir_balanceada),
+    ]
+    for tamanho in BENCHMARK_SIZES:
+        entradas = [
+            ("aleatoria", random.sample(range(tamanho * 10), tamanho)),
+            ("ordenada", list(range(tamanho))),
+            ("repetidos", [random.randrange(BENCHMARK_DISTINCT) for _ in range(tamanho)]),
+        ]
+        for ordem, valores in entradas:
+            for nome, construir in arvores:
+                if nome == "BST simples" and ordem != "aleatoria" and tamanho > BST_SORTED_LIMIT:
+                    valores_usados = valores[:BST_SORTED_LIMIT]
+                else:
+                    valores_usados = valores
+                tempo_insercao, tempo_busca, altura_final = medir_arvore(
+                    construir, valores_usados
+                )
+                registro = (
+                    f"{nome} | {ordem} | n={len(valores_usados)} | altura={altura_final} | "
+                    f"insercao={tempo_insercao:.4f}s | busca={tempo_busca:.4f}s"
+                )
+                print(registro)
+                linhas.append(registro)
+    caminho = os.path.join("outputs", "bst_benchmark.txt")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for linha in linhas:
+            arquivo.write(linha + "\n")
+    return caminho
+
+
 def garantir_pasta_saidas():
     if not os.path.exists("outputs"):
         os.makedirs("outputs")
@@ -191,9 +665,29 @@ def main():
     else:
         linhas.append("Nao havia subarvore direita apos as remocoes anteriores.")
 
+    # Mesma sequencia de valores numa AVL: altura O(log n) e sempre balanceada.
+    raiz_avl = None
+    for numero in valores:
+        raiz_avl = inserir_avl(raiz_avl, numero)
+    linhas.append("Altura da arvore AVL com os mesmos valores: " + str(altura(raiz_avl)))
+    linhas.append("A arvore AVL esta balanceada: " + str(esta_balanceada(raiz_avl)))
+
+    raiz_rebalanceada = rebalancear(raiz)
+    linhas.append(
+        "Altura apos rebalancear a BST restante: " + str(altura(raiz_rebalanceada))
+    )
+
     caminho = salvar_relatorio(linhas)
     print("Relatorio salvo em: " + caminho)
 
+    caminho_benchmark = executar_benchmark_balanceamento()
+    print("Benchmark BST x AVL salvo em: " + caminho_benchmark)
+
+    caminho_memoria = executar_benchmark_memoria()
+    print("Comparacao de memoria por no salva em: " + caminho_memoria)
+
 
 if __name__ == "__main__":
+    # A BST simples com chaves ordenadas recursa com profundidade igual a n.
+    sys.setrecursionlimit(BST_SORTED_LIMIT * 4)
     main()
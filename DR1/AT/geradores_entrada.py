@@ -0,0 +1,82 @@
+# Geradores de entradas reprodutiveis para os benchmarks de ordenacao.
+# A mesma combinacao de (distribuicao, tamanho, seed) sempre devolve a mesma lista.
+
+import itertools
+import random
+
+LIMITE_VALORES = 1000000
+SEED_PADRAO = 42
+
+
+def gerar_aleatoria(tamanho, rng, limite=LIMITE_VALORES):
+    # Inteiros uniformes entre 0 e limite.
+    return [rng.randint(0, limite) for _ in range(tamanho)]
+
+
+def gerar_ordenada(tamanho, rng, limite=LIMITE_VALORES):
+    # Inteiros aleatorios ja em ordem crescente.
+    return sorted(gerar_aleatoria(tamanho, rng, limite))
+
+
+def gerar_invertida(tamanho, rng, limite=LIMITE_VALORES):
+    # Inteiros aleatorios em ordem decrescente.
+    return sorted(gerar_aleatoria(tamanho, rng, limite), reverse=True)
+
+
+def gerar_organ_pipe(tamanho, rng, limite=LIMITE_VALORES):
+    # Metade crescente seguida de metade decrescente (formato de tubo de orgao).
+    valores = gerar_aleatoria(tamanho, rng, limite)
+    meio = tamanho // 2
+    return sorted(valores[:meio]) + sorted(valores[meio:], reverse=True)
+
+
+def gerar_k_ordenada(tamanho, rng, limite=LIMITE_VALORES, k=10):
+    # Lista quase ordenada: cada elemento fica a menos de k posicoes do lugar final.
+    valores = gerar_ordenada(tamanho, rng, limite)
+    for inicio in range(0, tamanho, k):
+        bloco = valores[inicio:inicio + k]
+        rng.shuffle(bloco)
+        valores[inicio:inicio + k] = bloco
+    return valores
+
+
+def gerar_poucos_unicos(tamanho, rng, unicos=10):
+    # Muitas repeticoes: apenas `unicos` valores distintos.
+    return [rng.randint(0, unicos - 1) for _ in range(tamanho)]
+
+
+def gerar_zipf(tamanho, rng, valores_distintos=1000, expoente=1.2):
+    # Valores de 1 a valores_distintos com frequencia proporcional a 1 / rank^expoente.
+    pesos = [1.0 / (rank ** expoente) for rank in range(1, valores_distintos + 1)]
+    acumulados = list(itertools.accumulate(pesos))
+    return rng.choices(range(1, valores_distintos + 1), cum_weights=acumulados, k=tamanho)
+
+
+def gerar_chaves_texto_longas(tamanho, rng, prefixo=64, sufixo=8):
+    # Strings com um prefixo comum longo: cada comparacao percorre muitos caracteres.
+    comum = "registro_" + "x" * prefixo
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    return [comum + "".join(rng.choices(letras, k=sufixo)) for _ in range(tamanho)]
+
+
+DISTRIBUICOES = {
+    "aleatoria": gerar_aleatoria,
+    "ordenada": gerar_ordenada,
+    "invertida": gerar_invertida,
+    "organ_pipe": gerar_organ_pipe,
+    "k_ordenada": gerar_k_ordenada,
+    "poucos_unicos": gerar_poucos_unicos,
+    "zipf": gerar_zipf,
+    "chaves_texto_longas": gerar_chaves_texto_longas,
+}
+
+# Distribuicoes cujos elementos sao inteiros (as demais geram strings).
+DISTRIBUICOES_NUMERICAS = [nome for nome in DISTRIBUICOES if nome != "chaves_texto_longas"]
+
+
+def gerar(distribuicao, tamanho, seed=SEED_PADRAO, **parametros):
+    # Gera a lista pedida com um gerador isolado, sem mexer no estado global de random.
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError("Distribuicao desconhecida: " + distribuicao)
+    rng = random.Random(f"{seed}-{distribuicao}-{tamanho}")
+    return DISTRIBUICOES[distribuicao](tamanho, rng, **parametros)
@@ -0,0 +1,169 @@
+# Instrumentacao opcional dos algoritmos de ordenacao: conta comparacoes,
+# movimentos e alocacoes. Os algoritmos nao mudam; a contagem acontece porque cada
+# elemento e embrulhado em ChaveContada e, nas ordenacoes in-place, a lista e
+# trocada por ListaContada. Sem instrumentacao nada e embrulhado, entao o custo
+# desligado e zero. Os numeros sao deterministicos e servem para testes de regressao.
+# Movimentos e alocacoes so sao contados quando o algoritmo trabalha inteiro na
+# lista recebida (em_lugar=True): copias e buffers criados por dentro nao passam
+# por nenhum ponto observavel, entao nos demais casos ficam como None (N/A).
+
+import importlib.util
+import os
+import sys
+
+
+class ContadorOperacoes:
+    __slots__ = ("comparacoes", "movimentos", "alocacoes")
+
+    def __init__(self):
+        self.comparacoes = 0
+        self.movimentos = None
+        self.alocacoes = None
+
+    def como_dict(self):
+        return {
+            "comparisons": self.comparacoes,
+            "moves": self.movimentos,
+            "allocations": self.alocacoes,
+        }
+
+
+class ChaveContada:
+    # Embrulha um valor e soma uma comparacao a cada operador relacional.
+    __slots__ = ("valor", "contador")
+
+    def __init__(self, valor, contador):
+        self.valor = valor
+        self.contador = contador
+
+    def __lt__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor < outro.valor
+
+    def __le__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor <= outro.valor
+
+    def __gt__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor > outro.valor
+
+    def __ge__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor >= outro.valor
+
+    def __eq__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor == outro.valor
+
+    def __ne__(self, outro):
+        self.contador.comparacoes += 1
+        return self.valor != outro.valor
+
+    __hash__ = None
+
+
+class ListaContada(list):
+    # Lista que conta cada elemento escrito (movimento) e cada elemento copiado
+    # para uma lista nova por fatia ou copy() (alocacao).
+    __slots__ = ("contador",)
+
+    def __init__(self, valores, contador):
+        super().__init__(valores)
+        self.contador = contador
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valor = list(valor)
+            self.contador.movimentos += len(valor)
+        else:
+            self.contador.movimentos += 1
+        super().__setitem__(indice, valor)
+
+    def __getitem__(self, indice):
+        resultado = super().__getitem__(indice)
+        if isinstance(indice, slice):
+            self.contador.alocacoes += len(resultado)
+        return resultado
+
+    def copy(self):
+        self.contador.alocacoes += len(self)
+        return list(self)
+
+
+def contar_operacoes(funcao, dados, em_lugar=False):
+    # Executa `funcao` sobre uma copia instrumentada e devolve o contador. Com
+    # em_lugar=True a funcao precisa ordenar a propria lista recebida.
+    contador = ContadorOperacoes()
+    entrada = [ChaveContada(valor, contador) for valor in dados]
+    if em_lugar:
+        contador.movimentos = 0
+        contador.alocacoes = 0
+        entrada = ListaContada(entrada, contador)
+    resultado = funcao(entrada)
+    if resultado is None:
+        resultado = entrada
+    if em_lugar and resultado is not entrada:
+        raise ValueError(funcao.__name__ + " nao ordenou a lista recebida")
+    valores = [item.valor for item in resultado]
+    for i in range(1, len(valores)):
+        if valores[i - 1] > valores[i]:
+            raise ValueError("Resultado incorreto encontrado em " + funcao.__name__)
+    return contador
+
+
+def formatar_contagem(valor):
+    return "N/A" if valor is None else str(valor)
+
+
+def carregar_modulo(nome, caminho):
+    # Importa um arquivo .py de outra pasta do repositorio pelo caminho, sem mexer
+    # no sys.path de quem chamou.
+    especificacao = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+def algoritmos_do_repositorio():
+    # Todas as ordenacoes por comparacao do repositorio que aceitam uma lista, com
+    # a indicacao de quais ordenam a propria lista (movimentos contaveis).
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    algoritmos_sort = carregar_modulo(
+        "algoritmos_sort", os.path.join(raiz, "PB", "TP1", "algoritmos_sort.py")
+    )
+    questao3 = carregar_modulo("questao3", os.path.join(raiz, "PB", "TP2", "questao3.py"))
+    heap_utils = carregar_modulo("heap_utils", os.path.join(raiz, "DR3", "TP1", "heap_utils.py"))
+    return [
+        ("PB/TP1 Bubble Sort", algoritmos_sort.bubble_sort, True),
+        ("PB/TP1 Selection Sort", algoritmos_sort.selection_sort, True),
+        ("PB/TP1 Insertion Sort", algoritmos_sort.insertion_sort, True),
+        ("PB/TP2 QuickSort", questao3.quicksort, True),
+        ("DR3/TP1 HeapSort", heap_utils.heapsort, False),
+    ]
+
+
+def main():
+    import geradores_entrada
+    import sorting_analysis
+
+    sys.setrecursionlimit(300000)
+    dados = geradores_entrada.gerar("aleatoria", 2000)
+    algoritmos = [
+        ("DR1/AT " + nome, funcao, nome in sorting_analysis.IN_PLACE_ALGORITHMS)
+        for nome, funcao in sorting_analysis.ALGORITHMS
+        if nome not in sorting_analysis.INTEGER_ONLY_ALGORITHMS
+    ]
+    algoritmos += algoritmos_do_repositorio()
+    print(f"{'Algoritmo':<32} {'Comparacoes':>12} {'Movimentos':>12} {'Alocacoes':>10}")
+    for nome, funcao, em_lugar in algoritmos:
+        contador = contar_operacoes(funcao, dados, em_lugar)
+        print(
+            f"{nome:<32} {contador.comparacoes:>12} "
+            f"{formatar_contagem(contador.movimentos):>12} "
+            f"{formatar_contagem(contador.alocacoes):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
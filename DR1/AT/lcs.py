@@ -1,4 +1,39 @@
+import csv
+import itertools
+import json
 import os
+import random
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Benchmark tabela completa x duas linhas x Hirschberg. A tabela completa guarda
+# (m+1)*(n+1) inteiros, entao ela so roda ate LCS_TABLE_LIMIT caracteres.
+LCS_BENCHMARK_SIZES = [500, 1000, 2000, 4000]
+LCS_TABLE_LIMIT = 2000
+# Subproblemas do Hirschberg com ate esse numero de celulas usam a tabela completa.
+HIRSCHBERG_BASE_CELULAS = 4096
+# O modo bit-paralelo so calcula o comprimento e e medido tambem em cadeias longas.
+LCS_BITPARALLEL_SIZES = [10000, 100000]
+# Memoizacao iterativa com faixa: cadeias quase iguais (poucas edicoes) e largura k.
+LCS_BANDED_SIZE = 20000
+LCS_BANDED_EDITS = 10
+LCS_BANDED_K = 40
+
+# Lote de pares: cada tarefa do pool leva LCS_BATCH_CHUNK pares e no maximo
+# LCS_BATCH_IN_FLIGHT tarefas por worker ficam pendentes, entao a entrada pode ser
+# um iterador de qualquer tamanho e a saida e gravada enquanto o lote anda.
+LCS_BATCH_CHUNK = 64
+LCS_BATCH_IN_FLIGHT = 2
+LCS_BATCH_PAIRS = 2000
+LCS_BATCH_LENGTH = 200
+LCS_BATCH_WORKERS = [1, 2, 4, 8]
+
+# Marcadores da tabela plana da memoizacao iterativa.
+DESCONHECIDO = -1
+INALCANCAVEL = -(1 << 30)
 
 
 def explicar_estrutura_otima():
@@ -32,6 +67,71 @@ def lcs_recursiva(x, y):
     return resolver(len(x), len(y))
 
 
+def lcs_memoizada_iterativa(x, y, k=None):
+    # Mesma memoizacao de cima para baixo da lcs_recursiva, mas com pilha explicita
+    # (sem limite de recursao) e tabela plana em array indexada por i*(n+1)+j, sem
+    # tuplas nem hash. Com k (distancia maxima de insercoes/remocoes conhecida) so
+    # a faixa |i - j| <= k e guardada: a tabela vira (m+1)*(2k+1) celulas e a
+    # coluna da celula (i, j) passa a ser j - i + k. Se a distancia real passar de
+    # k, devolve None.
+    m = len(x)
+    n = len(y)
+    banda = k is not None
+    if banda and abs(m - n) > k:
+        return None
+    largura = 2 * k + 1 if banda else n + 1
+    deslocamento = k if banda else 0
+    tabela = array("i", [DESCONHECIDO]) * ((m + 1) * largura)
+    # Vizinhos na tabela plana: em cima (i-1, j), diagonal (i-1, j-1), esquerda (i, j-1).
+    passo_cima = largura - 1 if banda else largura
+    passo_diagonal = largura if banda else largura + 1
+    linha_pilha = n + 1
+    pilha = [m * linha_pilha + n]
+    while pilha:
+        codigo = pilha[-1]
+        i, j = divmod(codigo, linha_pilha)
+        celula = i * largura + j - i * banda + deslocamento
+        if tabela[celula] != DESCONHECIDO:
+            pilha.pop()
+            continue
+        if i == 0 or j == 0:
+            tabela[celula] = 0
+            pilha.pop()
+            continue
+        if x[i - 1] == y[j - 1]:
+            valor = tabela[celula - passo_diagonal]
+            if valor == DESCONHECIDO:
+                pilha.append(codigo - linha_pilha - 1)
+                continue
+            tabela[celula] = valor + 1
+            pilha.pop()
+            continue
+        melhor = INALCANCAVEL
+        pendente = False
+        if not banda or j - i + 1 <= k:
+            valor = tabela[celula - passo_cima]
+            if valor == DESCONHECIDO:
+                pilha.append(codigo - linha_pilha)
+                pendente = True
+            elif valor > melhor:
+                melhor = valor
+        if not banda or i - j + 1 <= k:
+            valor = tabela[celula - 1]
+            if valor == DESCONHECIDO:
+                pilha.append(codigo - 1)
+                pendente = True
+            elif valor > melhor:
+                melhor = valor
+        if not pendente:
+            tabela[celula] = melhor
+            pilha.pop()
+
+    resultado = tabela[m * largura + n - m * banda + deslocamento]
+    if banda and (resultado < 0 or m + n - 2 * resultado > k):
+        return None
+    return resultado
+
+
 def lcs_dinamica(x, y):
     # Exercicio 4d: programacao dinamica iterativa.
     m = len(x)
@@ -66,6 +166,279 @@ def lcs_dinamica(x, y):
     return dp[m][n], "".join(subsequencia)
 
 
+def ultima_linha_lcs(x, y, anterior=None, atual=None):
+    # Comprimentos da LCS entre x inteiro e cada prefixo de y, guardando so duas linhas.
+    n = len(y)
+    if anterior is None:
+        anterior = [0] * (n + 1)
+        atual = [0] * (n + 1)
+    else:
+        anterior[:n + 1] = [0] * (n + 1)
+        atual[0] = 0
+    for caractere in x:
+        esquerda = 0
+        for j in range(n):
+            if caractere == y[j]:
+                esquerda = anterior[j] + 1
+            elif anterior[j + 1] > esquerda:
+                esquerda = anterior[j + 1]
+            atual[j + 1] = esquerda
+        anterior, atual = atual, anterior
+    return anterior
+
+
+def lcs_comprimento_duas_linhas(x, y):
+    # So o comprimento: memoria O(min(m, n)) colocando a cadeia menor nas colunas.
+    if len(y) > len(x):
+        x, y = y, x
+    return ultima_linha_lcs(x, y)[len(y)]
+
+
+def lcs_comprimento_bits(x, y):
+    # Comprimento por bits (Allison-Dix / Hyyro): cada posicao de x e um bit de um
+    # inteiro grande, entao uma linha inteira da tabela sai em poucas operacoes sobre
+    # palavras de 64 bits, sem laco Python por celula. V guarda com bit 0 as colunas
+    # em que a linha incrementa; a resposta e a quantidade de zeros.
+    if len(y) > len(x):
+        x, y = y, x
+    m = len(x)
+    if m == 0 or not y:
+        return 0
+    mascaras = {}
+    for posicao, caractere in enumerate(x):
+        mascaras[caractere] = mascaras.get(caractere, 0) | (1 << posicao)
+    todos = (1 << m) - 1
+    v = todos
+    for caractere in y:
+        casamentos = mascaras.get(caractere)
+        if casamentos is None:
+            continue
+        u = v & casamentos
+        v = ((v + u) | (v - u)) & todos
+    return m - v.bit_count()
+
+
+def lcs_hirschberg(x, y):
+    # Divisao e conquista de Hirschberg: reconstroi a subsequencia com memoria
+    # O(min(m, n)). Divide x ao meio, acha pelas linhas de frente e de tras o
+    # ponto de corte de y que maximiza a soma e resolve as duas metades.
+    # A pilha guarda so intervalos (ia, ja, ib, jb) de x e y, nunca copias: x
+    # (a cadeia maior) e lido por indices e so o trecho de y, de tamanho <= n,
+    # e copiado enquanto as duas linhas sao calculadas.
+    if len(y) > len(x):
+        x, y = y, x
+    n = len(y)
+    frente = [[0] * (n + 1), [0] * (n + 1)]
+    tras = [[0] * (n + 1), [0] * (n + 1)]
+    partes = []
+    pendentes = [(0, len(x), 0, n)]
+    while pendentes:
+        ia, ja, ib, jb = pendentes.pop()
+        if ia == ja or ib == jb:
+            continue
+        if ja - ia == 1:
+            if x[ia] in y[ib:jb]:
+                partes.append(x[ia])
+            continue
+        if (ja - ia) * (jb - ib) <= HIRSCHBERG_BASE_CELULAS:
+            partes.append(lcs_dinamica(x[ia:ja], y[ib:jb])[1])
+            continue
+        meio = (ia + ja) // 2
+        b = y[ib:jb]
+        linha_esquerda = ultima_linha_lcs(
+            (x[i] for i in range(ia, meio)), b, frente[0], frente[1]
+        )
+        linha_direita = ultima_linha_lcs(
+            (x[i] for i in range(ja - 1, meio - 1, -1)), b[::-1], tras[0], tras[1]
+        )
+        tamanho_b = jb - ib
+        corte = 0
+        melhor = -1
+        for k in range(tamanho_b + 1):
+            total = linha_esquerda[k] + linha_direita[tamanho_b - k]
+            if total > melhor:
+                melhor = total
+                corte = k
+        # A metade da direita entra primeiro na pilha para sair depois.
+        pendentes.append((meio, ja, ib + corte, jb))
+        pendentes.append((ia, meio, ib, ib + corte))
+    subsequencia = "".join(partes)
+    return len(subsequencia), subsequencia
+
+
+# Linhas da DP reaproveitadas entre os pares processados por um mesmo worker.
+_buffers_worker = [[0], [0]]
+
+
+def _comprimento_com_buffers(x, y):
+    # Duas linhas como lcs_comprimento_duas_linhas, mas sem alocar linhas novas a cada par.
+    if len(y) > len(x):
+        x, y = y, x
+    n = len(y)
+    if len(_buffers_worker[0]) <= n:
+        _buffers_worker[0] = [0] * (n + 1)
+        _buffers_worker[1] = [0] * (n + 1)
+    return ultima_linha_lcs(x, y, _buffers_worker[0], _buffers_worker[1])[n]
+
+
+def _processar_lote(lote):
+    # Roda dentro do worker: devolve (id, |a|, |b|, lcs, distancia) de cada par.
+    resultados = []
+    for identificador, a, b in lote:
+        comprimento = _comprimento_com_buffers(a, b)
+        resultados.append(
+            (identificador, len(a), len(b), comprimento, len(a) + len(b) - 2 * comprimento)
+        )
+    return resultados
+
+
+def ler_pares(caminho):
+    # Le pares "a<TAB>b" de um arquivo, um por linha, sem carregar o arquivo inteiro.
+    # Aceita fim de linha LF ou CRLF; linhas sem TAB sao avisadas e puladas para nao
+    # interromper o lote no meio.
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        for indice, linha in enumerate(arquivo):
+            linha = linha.rstrip("\r\n")
+            if not linha:
+                continue
+            if "\t" not in linha:
+                print(f"Linha {indice + 1} de {caminho} ignorada: sem TAB separando o par")
+                continue
+            a, b = linha.split("\t", 1)
+            yield indice, a, b
+
+
+def lcs_em_lote(pares, caminho_saida, workers=None, tamanho_lote=LCS_BATCH_CHUNK):
+    # Calcula a LCS de cada par (id, a, b) num ProcessPoolExecutor e grava os
+    # resultados na ordem de entrada em CSV (.csv) ou JSON Lines (.jsonl).
+    # Devolve (quantidade de pares, tempo gasto).
+    workers = workers or os.cpu_count() or 1
+    campos = ["id", "len_a", "len_b", "lcs", "distance"]
+    como_json = caminho_saida.endswith(".jsonl")
+    iterador = iter(pares)
+    total = 0
+    inicio = time.perf_counter()
+    with open(caminho_saida, "w", encoding="utf-8", newline="") as arquivo:
+        escritor = None
+        if not como_json:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(campos)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pendentes = deque()
+            while True:
+                while len(pendentes) < workers * LCS_BATCH_IN_FLIGHT:
+                    lote = list(itertools.islice(iterador, tamanho_lote))
+                    if not lote:
+                        break
+                    pendentes.append(executor.submit(_processar_lote, lote))
+                if not pendentes:
+                    break
+                for resultado in pendentes.popleft().result():
+                    if como_json:
+                        arquivo.write(json.dumps(dict(zip(campos, resultado))) + "\n")
+                    else:
+                        escritor.writerow(resultado)
+                    total += 1
+    return total, time.perf_counter() - inicio
+
+
+def executar_benchmark_lote():
+    # Pares/segundo do lcs_em_lote para cada quantidade de workers.
+    rng = random.Random(42)
+    minimo = LCS_BATCH_LENGTH // 2
+    caminho_pares = os.path.join("outputs", "lcs_batch_pairs.tsv")
+    with open(caminho_pares, "w", encoding="utf-8") as arquivo:
+        for _ in range(LCS_BATCH_PAIRS):
+            a = "".join(rng.choices("ACGT", k=rng.randint(minimo, LCS_BATCH_LENGTH)))
+            b = "".join(rng.choices("ACGT", k=rng.randint(minimo, LCS_BATCH_LENGTH)))
+            arquivo.write(a + "\t" + b + "\n")
+
+    nucleos = os.cpu_count() or 1
+    resultados = []
+    for workers in LCS_BATCH_WORKERS:
+        if workers > nucleos:
+            break
+        total, tempo = lcs_em_lote(
+            ler_pares(caminho_pares), os.path.join("outputs", "lcs_batch_results.csv"), workers
+        )
+        resultados.append((workers, tempo, total / tempo))
+        print(f"LCS em lote | workers={workers} | pares={total} | {total / tempo:.1f} pares/s")
+
+    caminho = os.path.join("outputs", "lcs_batch_scaling.csv")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("workers,time_seconds,pairs_per_second\n")
+        for linha in resultados:
+            arquivo.write(f"{linha[0]},{linha[1]:.6f},{linha[2]:.2f}\n")
+    return caminho
+
+
+def medir_lcs(funcao, x, y):
+    # Tempo e pico de memoria (tracemalloc) de uma chamada.
+    inicio = time.perf_counter()
+    funcao(x, y)
+    tempo = time.perf_counter() - inicio
+    tracemalloc.start()
+    try:
+        funcao(x, y)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return tempo, pico
+
+
+def executar_benchmark_lcs():
+    # Tabela completa x duas linhas x Hirschberg em cadeias aleatorias de DNA.
+    rng = random.Random(42)
+    modos = [
+        ("Tabela completa", lcs_dinamica),
+        ("Duas linhas (comprimento)", lcs_comprimento_duas_linhas),
+        ("Hirschberg", lcs_hirschberg),
+        ("Bit-paralelo (comprimento)", lcs_comprimento_bits),
+        ("Memoizacao iterativa", lcs_memoizada_iterativa),
+    ]
+    linhas = []
+    for tamanho in LCS_BENCHMARK_SIZES:
+        x = "".join(rng.choices("ACGT", k=tamanho))
+        y = "".join(rng.choices("ACGT", k=tamanho))
+        for nome, funcao in modos:
+            if funcao in (lcs_dinamica, lcs_memoizada_iterativa) and tamanho > LCS_TABLE_LIMIT:
+                continue
+            tempo, pico = medir_lcs(funcao, x, y)
+            registro = (
+                f"{nome} | n={tamanho} | tempo={tempo:.4f}s | pico={pico / 1024:.1f} KiB"
+            )
+            print(registro)
+            linhas.append(registro)
+    for tamanho in LCS_BITPARALLEL_SIZES:
+        x = "".join(rng.choices("ACGT", k=tamanho))
+        y = "".join(rng.choices("ACGT", k=tamanho))
+        tempo, pico = medir_lcs(lcs_comprimento_bits, x, y)
+        registro = (
+            f"Bit-paralelo (comprimento) | n={tamanho} | tempo={tempo:.4f}s | "
+            f"pico={pico / 1024:.1f} KiB"
+        )
+        print(registro)
+        linhas.append(registro)
+    x = "".join(rng.choices("ACGT", k=LCS_BANDED_SIZE))
+    y = list(x)
+    for _ in range(LCS_BANDED_EDITS):
+        del y[rng.randrange(len(y))]
+        y.insert(rng.randrange(len(y)), rng.choice("ACGT"))
+    y = "".join(y)
+    tempo, pico = medir_lcs(lambda a, b: lcs_memoizada_iterativa(a, b, LCS_BANDED_K), x, y)
+    registro = (
+        f"Memoizacao iterativa com faixa k={LCS_BANDED_K} | n={LCS_BANDED_SIZE} | "
+        f"tempo={tempo:.4f}s | pico={pico / 1024:.1f} KiB"
+    )
+    print(registro)
+    linhas.append(registro)
+    caminho = os.path.join("outputs", "lcs_benchmark.txt")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for linha in linhas:
+            arquivo.write(linha + "\n")
+    return caminho
+
+
 def salvar_relatorio(texto):
     if not os.path.exists("outputs"):
         os.makedirs("outputs")
@@ -81,17 +454,36 @@ def main():
 
     explicacao = explicar_estrutura_otima()
     comprimento_recursivo = lcs_recursiva(cadeia_a, cadeia_b)
+    comprimento_iterativo = lcs_memoizada_iterativa(cadeia_a, cadeia_b)
     comprimento_dp, subsequencia = lcs_dinamica(cadeia_a, cadeia_b)
+    comprimento_hirschberg, subsequencia_hirschberg = lcs_hirschberg(cadeia_a, cadeia_b)
 
     linhas = []
     linhas.append("Exercicio 4a: " + explicacao)
     linhas.append("Exercicio 4b: comprimento encontrado pela recursao = " + str(comprimento_recursivo))
+    linhas.append("Memoizacao com pilha explicita = " + str(comprimento_iterativo))
     linhas.append("Exercicio 4c: comprimento otimo = " + str(comprimento_dp))
     linhas.append("Exercicio 4d: subsequencia reconstruida = " + subsequencia)
+    linhas.append(
+        "Hirschberg (memoria linear): comprimento = "
+        + str(comprimento_hirschberg)
+        + ", subsequencia = "
+        + subsequencia_hirschberg
+    )
+    linhas.append(
+        "Duas linhas (so comprimento) = " + str(lcs_comprimento_duas_linhas(cadeia_a, cadeia_b))
+    )
+    linhas.append("Bit-paralelo (so comprimento) = " + str(lcs_comprimento_bits(cadeia_a, cadeia_b)))
 
     caminho = salvar_relatorio("\n".join(linhas))
     print("Relatorio salvo em: " + caminho)
 
+    caminho_benchmark = executar_benchmark_lcs()
+    print("Benchmark de memoria da LCS salvo em: " + caminho_benchmark)
+
+    caminho_lote = executar_benchmark_lote()
+    print("Escala do processamento em lote salva em: " + caminho_lote)
+
 
 if __name__ == "__main__":
     main()
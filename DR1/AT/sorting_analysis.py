@@ -1,13 +1,32 @@
+import gc
+import heapq
+import json
+import math
 import os
+import platform
 import random
+import statistics
 import sys
 import time
+import tracemalloc
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
+import geradores_entrada
+import instrumentacao
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - apenas instrui o usuario
+    np = None
+
 # Exercicio 1a: criar lista grande com 100000 numeros aleatorios.
 REFERENCE_SIZE = 100000
 REFERENCE_LIMIT = 1000000
@@ -17,7 +36,72 @@ SAMPLE_SIZES = [100, 500, 1000, 5000, 10000, 20000, 50000, 100000]
 
 # Conjuntos auxiliares para separar os graficos por complexidade observada.
 QUADRATIC_ALGORITHMS = ["Selection Sort", "Insertion Sort", "Bubble Sort"]
-LINEARITHMIC_ALGORITHMS = ["Merge Sort", "Quick Sort"]
+LINEARITHMIC_ALGORITHMS = [
+    "Merge Sort",
+    "Merge Sort Bottom-Up",
+    "Parallel Merge Sort",
+    "Quick Sort",
+    "Intro Sort",
+]
+
+# Parametros do Intro Sort: particoes pequenas vao para o Insertion Sort e
+# particoes grandes usam a mediana de nove (ninther) para escolher o pivo.
+INTRO_INSERTION_CUTOFF = 16
+INTRO_NINTHER_THRESHOLD = 128
+
+# Merge Sort bottom-up: blocos iniciais ordenados por insercao antes das intercalacoes.
+MERGE_RUN_SIZE = 32
+
+# O pico de memoria e medido numa execucao extra com tracemalloc. Os algoritmos
+# quadraticos ordenam no proprio vetor, entao acima deste tamanho a medicao extra
+# so dobraria minutos de execucao e a coluna fica vazia no CSV.
+MEMORY_QUADRATIC_LIMIT = 10000
+
+# Medicao estatistica: rodadas de aquecimento, repeticoes cronometradas com o
+# coletor de lixo desligado e resumo por mediana/IQR/minimo. Rodadas que passam de
+# BENCH_LONG_RUN_SECONDS no aquecimento usam menos repeticoes.
+BENCH_WARMUP = 1
+BENCH_REPETITIONS = 5
+BENCH_REPETITIONS_LONG = 3
+BENCH_LONG_RUN_SECONDS = 1.0
+
+# Contagem deterministica de comparacoes, movimentos e alocacoes (instrumentacao.py),
+# feita num tamanho pequeno porque os objetos embrulhados sao bem mais lentos.
+INSTRUMENTATION_SIZE = 2000
+# Ordenacoes que escrevem apenas na lista recebida: so nelas movimentos e
+# alocacoes sao contados; nas demais aparecem como N/A.
+IN_PLACE_ALGORITHMS = [
+    "Selection Sort",
+    "Insertion Sort",
+    "Bubble Sort",
+    "Quick Sort",
+    "Intro Sort",
+]
+
+# Corte adaptativo: antes de cada tamanho o tempo de uma execucao e previsto
+# ajustando o modelo de complexidade (n^2 ou n log n) aos tamanhos ja medidos.
+# Se a previsao passar do orcamento, o ponto e extrapolado em vez de executado.
+TIME_BUDGET_SECONDS = 1.0
+
+# Comparacao entre execucoes: se existir um JSON de referencia, medianas que
+# pioram mais que a tolerancia (e alem do IQR) sao registradas como regressao.
+BASELINE_JSON = os.path.join("outputs", "sorting_baseline.json")
+REGRESSION_TOLERANCE = 0.10
+
+# Curva de speedup do Merge Sort paralelo (limitada pela quantidade de nucleos).
+PARALLEL_WORKERS = [1, 2, 4, 8, 16]
+
+# Backends vetorizados com numpy: sem lacos Python por elemento, o que permite
+# medir ate 10^7 elementos.
+NUMPY_SAMPLE_SIZES = [100000, 1000000, 5000000, 10000000]
+RADIX_BITS = 8
+
+# Varredura algoritmos x distribuicoes x tamanhos com as entradas de
+# geradores_entrada. O orcamento de tempo tambem vale aqui, entao o Quick Sort
+# com pivo fixo deixa de ser executado quando degrada para O(n^2).
+SWEEP_SIZES = [1000, 10000, 100000]
+# Algoritmos que dependem de inteiros (memoria compartilhada em int64).
+INTEGER_ONLY_ALGORITHMS = ["Parallel Merge Sort"]
 
 random.seed(42)
 
@@ -90,6 +174,102 @@ def merge_listas(esquerda, direita):
     return resultado
 
 
+def merge_sort_bottom_up(arr):
+    # Merge Sort iterativo: um unico buffer auxiliar alternando origem e destino
+    # a cada passada, sem fatiar listas nem criar uma lista nova por intercalacao.
+    n = len(arr)
+    if n < 2:
+        return arr
+    for inicio in range(0, n, MERGE_RUN_SIZE):
+        insertion_sort_intervalo(arr, inicio, min(inicio + MERGE_RUN_SIZE, n) - 1)
+    origem = arr
+    destino = [0] * n
+    largura = MERGE_RUN_SIZE
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            if meio >= fim or origem[meio - 1] <= origem[meio]:
+                # Blocos ja em ordem: apenas copia, sem comparar elemento a elemento.
+                for k in range(inicio, fim):
+                    destino[k] = origem[k]
+            else:
+                intercala_intervalo(origem, destino, inicio, meio, fim)
+        origem, destino = destino, origem
+        largura *= 2
+    if origem is not arr:
+        arr[:] = origem
+    return arr
+
+
+def intercala_intervalo(origem, destino, inicio, meio, fim):
+    # Intercala origem[inicio:meio] e origem[meio:fim] em destino[inicio:fim].
+    i = inicio
+    j = meio
+    k = inicio
+    while i < meio and j < fim:
+        if origem[j] < origem[i]:
+            destino[k] = origem[j]
+            j += 1
+        else:
+            destino[k] = origem[i]
+            i += 1
+        k += 1
+    while i < meio:
+        destino[k] = origem[i]
+        i += 1
+        k += 1
+    while j < fim:
+        destino[k] = origem[j]
+        j += 1
+        k += 1
+
+
+def ordena_bloco_compartilhado(nome_memoria, inicio, fim):
+    # Executado no processo filho: le o bloco direto da memoria compartilhada,
+    # ordena e escreve de volta no mesmo lugar, sem serializar os dados.
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    vetor = memoria.buf.cast("q")
+    try:
+        bloco = merge_sort_bottom_up(vetor[inicio:fim].tolist())
+        vetor[inicio:fim] = array("q", bloco)
+    finally:
+        vetor.release()
+        memoria.close()
+
+
+def parallel_merge_sort(arr, workers=None):
+    # Merge Sort paralelo: um bloco por nucleo ordenado num ProcessPoolExecutor
+    # sobre memoria compartilhada e intercalacao final k-way com heap.
+    n = len(arr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if n < 2:
+        return arr
+    # Um bloco quase do mesmo tamanho por processo (diferenca de no maximo 1).
+    blocos = max(1, min(workers, n))
+    limites = [(i * n // blocos, (i + 1) * n // blocos) for i in range(blocos)]
+
+    memoria = shared_memory.SharedMemory(create=True, size=n * array("q").itemsize)
+    vetor = memoria.buf.cast("q")
+    try:
+        vetor[:] = array("q", arr)
+        with ProcessPoolExecutor(max_workers=blocos) as executor:
+            futures = [
+                executor.submit(ordena_bloco_compartilhado, memoria.name, inicio, fim)
+                for inicio, fim in limites
+            ]
+            for futuro in futures:
+                futuro.result()
+        blocos = [vetor[inicio:fim].tolist() for inicio, fim in limites]
+    finally:
+        vetor.release()
+        memoria.close()
+        memoria.unlink()
+    arr[:] = heapq.merge(*blocos)
+    return arr
+
+
 def quick_sort(arr):
     # Exercicio 1b-v: Quick Sort usando o ultimo elemento como pivo.
     particiona_quick(arr, 0, len(arr) - 1)
@@ -110,12 +290,164 @@ def particiona_quick(arr, inicio, fim):
         particiona_quick(arr, pos_pivo + 1, fim)
 
 
+def intro_sort(arr):
+    # Intro Sort iterativo: quicksort com pilha explicita, pivo por mediana de tres
+    # (ou ninther), Insertion Sort nas particoes pequenas e Heap Sort quando a
+    # profundidade passa de 2*log2(n), garantindo O(n log n) no pior caso.
+    n = len(arr)
+    if n < 2:
+        return arr
+    limite_profundidade = 2 * int(math.log2(n))
+    pilha = [(0, n - 1, limite_profundidade)]
+    while pilha:
+        inicio, fim, profundidade = pilha.pop()
+        while fim - inicio + 1 > INTRO_INSERTION_CUTOFF:
+            if profundidade == 0:
+                heap_sort_intervalo(arr, inicio, fim)
+                break
+            profundidade -= 1
+            pivo = escolher_pivo_intro(arr, inicio, fim)
+            menor, maior = particiona_tres_vias(arr, inicio, fim, pivo)
+            # Empilha a particao maior e continua na menor: a pilha fica O(log n).
+            if menor - inicio < fim - maior:
+                pilha.append((maior + 1, fim, profundidade))
+                fim = menor - 1
+            else:
+                pilha.append((inicio, menor - 1, profundidade))
+                inicio = maior + 1
+        else:
+            insertion_sort_intervalo(arr, inicio, fim)
+    return arr
+
+
+def mediana_de_tres(arr, a, b, c):
+    # Devolve o indice do valor mediano entre as posicoes a, b e c.
+    va = arr[a]
+    vb = arr[b]
+    vc = arr[c]
+    if va < vb:
+        if vb < vc:
+            return b
+        return c if va < vc else a
+    if va < vc:
+        return a
+    return c if vb < vc else b
+
+
+def escolher_pivo_intro(arr, inicio, fim):
+    meio = inicio + (fim - inicio) // 2
+    if fim - inicio + 1 < INTRO_NINTHER_THRESHOLD:
+        return arr[mediana_de_tres(arr, inicio, meio, fim)]
+    # Ninther de Tukey: mediana das medianas de tres trios espalhados.
+    passo = (fim - inicio + 1) // 8
+    primeiro = mediana_de_tres(arr, inicio, inicio + passo, inicio + 2 * passo)
+    segundo = mediana_de_tres(arr, meio - passo, meio, meio + passo)
+    terceiro = mediana_de_tres(arr, fim - 2 * passo, fim - passo, fim)
+    return arr[mediana_de_tres(arr, primeiro, segundo, terceiro)]
+
+
+def particiona_tres_vias(arr, inicio, fim, pivo):
+    # Particao de Dijkstra: menores | iguais ao pivo | maiores. Com muitos
+    # valores repetidos o bloco do meio sai da recursao de uma vez.
+    menor = inicio
+    i = inicio
+    maior = fim
+    while i <= maior:
+        valor = arr[i]
+        if valor < pivo:
+            arr[menor], arr[i] = valor, arr[menor]
+            menor += 1
+            i += 1
+        elif valor > pivo:
+            arr[i], arr[maior] = arr[maior], valor
+            maior -= 1
+        else:
+            i += 1
+    return menor, maior
+
+
+def insertion_sort_intervalo(arr, inicio, fim):
+    for i in range(inicio + 1, fim + 1):
+        chave = arr[i]
+        j = i - 1
+        while j >= inicio and arr[j] > chave:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = chave
+
+
+def heap_sort_intervalo(arr, inicio, fim):
+    # Heap Sort restrito a arr[inicio..fim], usado como saida de emergencia do Intro Sort.
+    tamanho = fim - inicio + 1
+    for raiz in range(tamanho // 2 - 1, -1, -1):
+        desce_heap_intervalo(arr, inicio, raiz, tamanho)
+    for ultimo in range(tamanho - 1, 0, -1):
+        arr[inicio], arr[inicio + ultimo] = arr[inicio + ultimo], arr[inicio]
+        desce_heap_intervalo(arr, inicio, 0, ultimo)
+
+
+def desce_heap_intervalo(arr, deslocamento, raiz, tamanho):
+    while True:
+        filho = 2 * raiz + 1
+        if filho >= tamanho:
+            return
+        if filho + 1 < tamanho and arr[deslocamento + filho + 1] > arr[deslocamento + filho]:
+            filho += 1
+        if arr[deslocamento + filho] <= arr[deslocamento + raiz]:
+            return
+        arr[deslocamento + raiz], arr[deslocamento + filho] = (
+            arr[deslocamento + filho],
+            arr[deslocamento + raiz],
+        )
+        raiz = filho
+
+
+def radix_sort_numpy(vetor):
+    # Radix Sort LSD sobre inteiros nao negativos: cada passada ordena de forma
+    # estavel por um digito de RADIX_BITS bits. O numpy usa counting/radix sort
+    # internamente no argsort estavel de uint8, entao cada passada e O(n).
+    if vetor.size < 2:
+        return vetor
+    mascara = (1 << RADIX_BITS) - 1
+    maior = int(vetor.max())
+    deslocamento = 0
+    while (maior >> deslocamento) > 0:
+        digitos = ((vetor >> deslocamento) & mascara).astype(np.uint8)
+        vetor = vetor[np.argsort(digitos, kind="stable")]
+        deslocamento += RADIX_BITS
+    return vetor
+
+
+def counting_sort_numpy(vetor):
+    # Counting Sort para inteiros limitados (0..REFERENCE_LIMIT): conta as
+    # ocorrencias de cada valor e repete cada valor pela sua contagem.
+    if vetor.size < 2:
+        return vetor
+    contagens = np.bincount(vetor)
+    return np.repeat(np.arange(contagens.size, dtype=vetor.dtype), contagens)
+
+
+def sort_estavel_numpy(vetor):
+    # Linha de base: ordenacao estavel nativa do numpy.
+    return np.sort(vetor, kind="stable")
+
+
+NUMPY_ALGORITHMS = [
+    ("Radix Sort (numpy)", radix_sort_numpy),
+    ("Counting Sort (numpy)", counting_sort_numpy),
+    ("np.sort stable", sort_estavel_numpy),
+]
+
+
 ALGORITHMS = [
     ("Selection Sort", selection_sort),
     ("Insertion Sort", insertion_sort),
     ("Bubble Sort", bubble_sort),
     ("Merge Sort", merge_sort),
+    ("Merge Sort Bottom-Up", merge_sort_bottom_up),
+    ("Parallel Merge Sort", parallel_merge_sort),
     ("Quick Sort", quick_sort),
+    ("Intro Sort", intro_sort),
 ]
 
 
@@ -132,23 +464,183 @@ def criar_lista_referencia():
     return numeros
 
 
+def modelo_complexidade(nome, medidos=()):
+    # Com dois pontos medidos o modelo segue o crescimento observado (o Quick Sort
+    # em entrada ordenada e quadratico); antes disso vale a classificacao teorica.
+    quadratico = nome in QUADRATIC_ALGORITHMS
+    if len(medidos) >= 2:
+        (n1, t1), (n2, t2) = medidos[-2:]
+        if t1 > 0 and t2 > 0 and n2 > n1:
+            quadratico = math.log(t2 / t1) / math.log(n2 / n1) > 1.5
+    if quadratico:
+        return lambda n: n * n
+    return lambda n: n * math.log2(n) if n > 1 else 1
+
+
+def prever_tempo(medidos, tamanho, modelo):
+    # Minimos quadrados para t = c * f(n) sobre os pontos (n, t) ja medidos.
+    numerador = 0.0
+    denominador = 0.0
+    for n, tempo in medidos:
+        numerador += tempo * modelo(n)
+        denominador += modelo(n) ** 2
+    if denominador == 0:
+        return None
+    return numerador / denominador * modelo(tamanho)
+
+
+def verificar_ordenacao(funcao, dados, resultado):
+    # Verificacao linear, feita uma vez e fora da regiao cronometrada.
+    for i in range(1, len(resultado)):
+        if resultado[i - 1] > resultado[i]:
+            raise ValueError("Resultado incorreto encontrado em " + funcao.__name__)
+    if len(resultado) != len(dados) or Counter(resultado) != Counter(dados):
+        raise ValueError("Resultado incorreto encontrado em " + funcao.__name__)
+
+
+def medir_algoritmo(
+    funcao,
+    dados,
+    repeticoes=BENCH_REPETITIONS,
+    aquecimento=BENCH_WARMUP,
+    verificar=verificar_ordenacao,
+):
+    # Exercicio 1d: executar cada algoritmo e medir o tempo gasto, agora com
+    # aquecimento, varias repeticoes e o GC desligado durante a cronometragem.
+    # `dados` pode ser lista ou array numpy: ambos tem copy().
+    for _ in range(aquecimento):
+        copia = dados.copy()
+        inicio = time.perf_counter()
+        funcao(copia)
+        if time.perf_counter() - inicio > BENCH_LONG_RUN_SECONDS:
+            repeticoes = min(repeticoes, BENCH_REPETITIONS_LONG)
+
+    tempos = []
+    resultado = None
+    gc_estava_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            copia = dados.copy()
+            inicio = time.perf_counter()
+            resultado = funcao(copia)
+            tempos.append(time.perf_counter() - inicio)
+    finally:
+        if gc_estava_ativo:
+            gc.enable()
+    verificar(funcao, dados, resultado)
+    return resumir_tempos(tempos)
+
+
+def resumir_tempos(tempos):
+    if len(tempos) > 1:
+        q1, mediana, q3 = statistics.quantiles(tempos, n=4, method="inclusive")
+    else:
+        q1 = mediana = q3 = tempos[0]
+    return {
+        "median": mediana,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "min": min(tempos),
+        "repetitions": len(tempos),
+        "times": tempos,
+    }
+
+
 def executar_algoritmo(funcao, dados):
-    # Exercicio 1d: executar cada algoritmo e medir o tempo gasto.
+    # Atalho que devolve apenas a mediana das repeticoes.
+    return medir_algoritmo(funcao, dados)["median"]
+
+
+def contar_operacoes_algoritmos(referencia):
+    dados = referencia[:INSTRUMENTATION_SIZE]
+    operacoes = {}
+    for nome, funcao in ALGORITHMS:
+        if nome in INTEGER_ONLY_ALGORITHMS:
+            continue
+        contador = instrumentacao.contar_operacoes(funcao, dados, nome in IN_PLACE_ALGORITHMS)
+        operacoes[nome] = contador.como_dict()
+    return operacoes
+
+
+def detectar_regressoes_operacoes(operacoes, caminho_baseline):
+    # Contagens sao deterministicas: qualquer aumento em relacao ao baseline conta.
+    with open(caminho_baseline, "r", encoding="utf-8") as arquivo:
+        baseline = json.load(arquivo)
+    anteriores = baseline.get("operations", {})
+    if anteriores.get("size") != INSTRUMENTATION_SIZE:
+        return []
+    regressoes = []
+    for nome, contagens in operacoes.items():
+        antes = anteriores["counts"].get(nome, {})
+        for metrica, valor in contagens.items():
+            if valor is None or antes.get(metrica) is None:
+                continue
+            if valor > antes[metrica]:
+                regressoes.append((nome, metrica, antes[metrica], valor))
+    return regressoes
+
+
+def salvar_json(medicoes, operacoes):
+    # Saida legivel por maquina para comparar execucoes entre commits.
+    caminho = os.path.join("outputs", "sorting_results.json")
+    documento = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "warmup": BENCH_WARMUP,
+        "repetitions": BENCH_REPETITIONS,
+        "time_budget_seconds": TIME_BUDGET_SECONDS,
+        "results": medicoes,
+        "operations": {"size": INSTRUMENTATION_SIZE, "counts": operacoes},
+    }
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(documento, arquivo, indent=2)
+    return caminho
+
+
+def detectar_regressoes(medicoes, caminho_baseline, tolerancia=REGRESSION_TOLERANCE):
+    # Compara as medianas atuais com um JSON salvo anteriormente por salvar_json.
+    with open(caminho_baseline, "r", encoding="utf-8") as arquivo:
+        baseline = json.load(arquivo)
+    anteriores = {}
+    for item in baseline["results"]:
+        anteriores[(item["algorithm"], item["size"])] = item
+    regressoes = []
+    for item in medicoes:
+        anterior = anteriores.get((item["algorithm"], item["size"]))
+        if anterior is None or item.get("extrapolated") or anterior.get("extrapolated"):
+            continue
+        limite = max(
+            anterior["median"] * (1 + tolerancia),
+            anterior["median"] + anterior["iqr"] + item["iqr"],
+        )
+        if item["median"] > limite:
+            regressoes.append((item["algorithm"], item["size"], anterior["median"], item["median"]))
+    return regressoes
+
+
+def medir_memoria_pico(funcao, dados):
+    # Pico de memoria (bytes) alocada pelo algoritmo, sem contar a copia de entrada.
     copia = dados[:]
-    inicio = time.perf_counter()
-    resultado = funcao(copia)
-    fim = time.perf_counter()
-    if resultado != sorted(dados):
-        raise ValueError("Resultado incorreto encontrado em " + funcao.__name__)
-    return fim - inicio
+    tracemalloc.start()
+    try:
+        funcao(copia)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
 
 
 def salvar_csv(resultados):
     caminho = os.path.join("outputs", "sorting_results.csv")
     with open(caminho, "w", encoding="utf-8") as arquivo:
-        arquivo.write("algorithm,size,time_seconds\n")
+        arquivo.write("algorithm,size,time_seconds,peak_memory_bytes,extrapolated\n")
         for linha in resultados:
-            arquivo.write(f"{linha[0]},{linha[1]},{linha[2]:.6f}\n")
+            memoria = "" if linha[3] is None else str(linha[3])
+            extrapolado = 1 if linha[4] else 0
+            arquivo.write(f"{linha[0]},{linha[1]},{linha[2]:.6f},{memoria},{extrapolado}\n")
     return caminho
 
 
@@ -159,12 +651,30 @@ def plotar_grafico(resultados, nomes_algoritmos, nome_arquivo, titulo):
     for nome in nomes_algoritmos:
         xs = []
         ys = []
+        xs_extrapolados = []
+        ys_extrapolados = []
         for item in resultados:
-            if item[0] == nome:
+            if item[0] != nome:
+                continue
+            if len(item) > 4 and item[4]:
+                xs_extrapolados.append(item[1])
+                ys_extrapolados.append(item[2])
+            else:
                 xs.append(item[1])
                 ys.append(item[2])
         if xs:
-            plt.plot(xs, ys, marker="o", label=nome)
+            linha = plt.plot(xs, ys, marker="o", label=nome)[0]
+            if xs_extrapolados:
+                # Pontos extrapolados pelo corte adaptativo: tracejado e sem preenchimento.
+                plt.plot(
+                    xs[-1:] + xs_extrapolados,
+                    ys[-1:] + ys_extrapolados,
+                    marker="o",
+                    markerfacecolor="none",
+                    linestyle="--",
+                    color=linha.get_color(),
+                    label=nome + " (extrapolado)",
+                )
     plt.xlabel("Tamanho da entrada")
     plt.ylabel("Tempo (s)")
     plt.title(titulo)
@@ -184,16 +694,27 @@ def escrever_relatorio(resultados, linhas_log):
             arquivo.write(linha + "\n")
         arquivo.write("\nResumo geral:\n")
         for nome, _ in ALGORITHMS:
-            escolhidos = [item for item in resultados if item[0] == nome]
+            escolhidos = [item for item in resultados if item[0] == nome and not item[4]]
+            extrapolados = [item for item in resultados if item[0] == nome and item[4]]
             if escolhidos:
                 ultimo = escolhidos[-1]
                 arquivo.write(
                     f"{nome}: executado ate n={ultimo[1]} com tempo final de {ultimo[2]:.4f}s\n"
                 )
+            if extrapolados:
+                ultimo = extrapolados[-1]
+                arquivo.write(
+                    f"{nome}: extrapolado ate n={ultimo[1]} com tempo previsto de {ultimo[2]:.4f}s\n"
+                )
         arquivo.write(
             "\nConclusao: algoritmos quadraticos demoram muito para entradas grandes, "
             "enquanto Merge Sort e Quick Sort mantem tempos baixos mesmo com 100000 elementos.\n"
         )
+        arquivo.write(
+            "Intro Sort mantem O(n log n) tambem em entradas ordenadas, invertidas e com poucos "
+            "valores distintos, onde o Quick Sort com pivo fixo degrada para O(n^2) "
+            "(ver `distribution_sweep.csv`).\n"
+        )
         arquivo.write(
             "Graficos gerados: `sorting_times_n2.png` para os algoritmos O(n^2) e "
             "`sorting_times_nlogn.png` para os algoritmos com comportamento proximo de n log n.\n"
@@ -209,20 +730,221 @@ def salvar_log(linhas_log):
     return caminho
 
 
+def criar_vetor_referencia_numpy():
+    # Vetor base para os backends numpy, gerado direto como array (sem lista Python).
+    gerador = np.random.default_rng(42)
+    return gerador.integers(0, REFERENCE_LIMIT + 1, size=NUMPY_SAMPLE_SIZES[-1], dtype=np.int64)
+
+
+def verificar_ordenacao_numpy(funcao, vetor, resultado):
+    # Mesma verificacao de verificar_ordenacao, vetorizada: ordenado e com as mesmas contagens.
+    ordenado = bool(np.all(resultado[:-1] <= resultado[1:]))
+    if not ordenado or not np.array_equal(np.bincount(resultado), np.bincount(vetor)):
+        raise ValueError("Resultado incorreto encontrado em " + funcao.__name__)
+
+
+def salvar_csv_numpy(resultados):
+    caminho = os.path.join("outputs", "numpy_sorting_results.csv")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("algorithm,size,time_seconds\n")
+        for linha in resultados:
+            arquivo.write(f"{linha[0]},{linha[1]},{linha[2]:.6f}\n")
+    return caminho
+
+
+def executar_benchmarks_numpy(linhas_log, medicoes):
+    if np is None:
+        aviso = "AVISO: numpy nao encontrado. Instale com `pip install numpy` para os backends vetorizados."
+        print(aviso)
+        linhas_log.append(aviso)
+        return []
+    # A conversao acontece uma unica vez; os prefixos sao views sem copia.
+    referencia = criar_vetor_referencia_numpy()
+    resultados = []
+    for tamanho in NUMPY_SAMPLE_SIZES:
+        subconjunto = referencia[:tamanho]
+        for nome, funcao in NUMPY_ALGORITHMS:
+            estatisticas = medir_algoritmo(
+                funcao, subconjunto, verificar=verificar_ordenacao_numpy
+            )
+            tempo_gasto = estatisticas["median"]
+            resultados.append((nome, tamanho, tempo_gasto))
+            medicoes.append(
+                {
+                    "algorithm": nome,
+                    "size": tamanho,
+                    "peak_memory_bytes": None,
+                    "extrapolated": False,
+                    **estatisticas,
+                }
+            )
+            registro = (
+                f"{nome} | n={tamanho} | tempo={tempo_gasto:.4f}s "
+                f"(min={estatisticas['min']:.4f}s, iqr={estatisticas['iqr']:.4f}s)"
+            )
+            print(registro)
+            linhas_log.append(registro)
+    salvar_csv_numpy(resultados)
+    plotar_grafico(
+        resultados,
+        [nome for nome, _ in NUMPY_ALGORITHMS],
+        "sorting_times_numpy.png",
+        "Tempos dos backends vetorizados (numpy)",
+    )
+    return resultados
+
+
+def executar_speedup_paralelo(referencia, linhas_log):
+    # Speedup do Merge Sort paralelo em relacao ao Merge Sort bottom-up sequencial.
+    tempo_sequencial = executar_algoritmo(merge_sort_bottom_up, referencia)
+    nucleos = os.cpu_count() or 1
+    resultados = []
+    for workers in PARALLEL_WORKERS:
+        if workers > nucleos:
+            break
+        tempo_gasto = executar_algoritmo(
+            lambda dados: parallel_merge_sort(dados, workers), referencia
+        )
+        speedup = tempo_sequencial / tempo_gasto
+        resultados.append((workers, tempo_gasto, speedup))
+        registro = (
+            f"Parallel Merge Sort | workers={workers} | n={len(referencia)} | "
+            f"tempo={tempo_gasto:.4f}s | speedup={speedup:.2f}x"
+        )
+        print(registro)
+        linhas_log.append(registro)
+
+    caminho = os.path.join("outputs", "parallel_speedup.csv")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("workers,time_seconds,speedup\n")
+        for linha in resultados:
+            arquivo.write(f"{linha[0]},{linha[1]:.6f},{linha[2]:.4f}\n")
+
+    plt.figure(figsize=(10, 6))
+    xs = [linha[0] for linha in resultados]
+    plt.plot(xs, [linha[2] for linha in resultados], marker="o", label="Parallel Merge Sort")
+    plt.plot(xs, xs, linestyle="--", label="Speedup ideal")
+    plt.xlabel("Quantidade de processos")
+    plt.ylabel("Speedup sobre o Merge Sort sequencial")
+    plt.title(f"Speedup x workers (n={len(referencia)})")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(os.path.join("outputs", "parallel_speedup.png"))
+    plt.close()
+    return resultados
+
+
+def salvar_csv_varredura(resultados):
+    caminho = os.path.join("outputs", "distribution_sweep.csv")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("algorithm,distribution,size,time_seconds,extrapolated\n")
+        for linha in resultados:
+            extrapolado = 1 if linha[4] else 0
+            arquivo.write(f"{linha[0]},{linha[1]},{linha[2]},{linha[3]:.6f},{extrapolado}\n")
+    return caminho
+
+
+def executar_varredura_distribuicoes(linhas_log):
+    # Todos os algoritmos em todas as distribuicoes de geradores_entrada, com o
+    # mesmo corte adaptativo por orcamento de tempo da varredura principal.
+    resultados = []
+    for distribuicao in geradores_entrada.DISTRIBUICOES:
+        numerica = distribuicao in geradores_entrada.DISTRIBUICOES_NUMERICAS
+        medidos = {nome: [] for nome, _ in ALGORITHMS}
+        for tamanho in SWEEP_SIZES:
+            dados = geradores_entrada.gerar(distribuicao, tamanho)
+            for nome, funcao in ALGORITHMS:
+                if not numerica and nome in INTEGER_ONLY_ALGORITHMS:
+                    continue
+                previsto = prever_tempo(
+                    medidos[nome], tamanho, modelo_complexidade(nome, medidos[nome])
+                )
+                if previsto is not None and previsto > TIME_BUDGET_SECONDS:
+                    resultados.append((nome, distribuicao, tamanho, previsto, True))
+                    registro = (
+                        f"{nome} | {distribuicao} | n={tamanho} | "
+                        f"tempo previsto={previsto:.4f}s (extrapolado)"
+                    )
+                else:
+                    tempo_gasto = executar_algoritmo(funcao, dados)
+                    medidos[nome].append((tamanho, tempo_gasto))
+                    resultados.append((nome, distribuicao, tamanho, tempo_gasto, False))
+                    registro = f"{nome} | {distribuicao} | n={tamanho} | tempo={tempo_gasto:.4f}s"
+                print(registro)
+                linhas_log.append(registro)
+    salvar_csv_varredura(resultados)
+    return resultados
+
+
 def executar_benchmarks():
     garantir_pasta_saidas()
     referencia = criar_lista_referencia()
     resultados = []
+    medicoes = []
     linhas_log = []
+    medidos = {nome: [] for nome, _ in ALGORITHMS}
     for tamanho in SAMPLE_SIZES:
         subconjunto = referencia[:tamanho]
         for nome, funcao in ALGORITHMS:
-            tempo_gasto = executar_algoritmo(funcao, subconjunto)
-            resultados.append((nome, tamanho, tempo_gasto))
-            registro = f"{nome} | n={tamanho} | tempo={tempo_gasto:.4f}s"
+            previsto = prever_tempo(medidos[nome], tamanho, modelo_complexidade(nome, medidos[nome]))
+            if previsto is not None and previsto > TIME_BUDGET_SECONDS:
+                # Acima do orcamento: registra a previsao e nao executa.
+                resultados.append((nome, tamanho, previsto, None, True))
+                medicoes.append(
+                    {"algorithm": nome, "size": tamanho, "median": previsto, "extrapolated": True}
+                )
+                registro = f"{nome} | n={tamanho} | tempo previsto={previsto:.4f}s (extrapolado)"
+                print(registro)
+                linhas_log.append(registro)
+                continue
+            estatisticas = medir_algoritmo(funcao, subconjunto)
+            tempo_gasto = estatisticas["median"]
+            pico_memoria = None
+            if nome not in QUADRATIC_ALGORITHMS or tamanho <= MEMORY_QUADRATIC_LIMIT:
+                pico_memoria = medir_memoria_pico(funcao, subconjunto)
+            medidos[nome].append((tamanho, tempo_gasto))
+            resultados.append((nome, tamanho, tempo_gasto, pico_memoria, False))
+            medicoes.append(
+                {
+                    "algorithm": nome,
+                    "size": tamanho,
+                    "peak_memory_bytes": pico_memoria,
+                    "extrapolated": False,
+                    **estatisticas,
+                }
+            )
+            registro = (
+                f"{nome} | n={tamanho} | tempo={tempo_gasto:.4f}s "
+                f"(min={estatisticas['min']:.4f}s, iqr={estatisticas['iqr']:.4f}s)"
+            )
+            if pico_memoria is not None:
+                registro += f" | memoria_pico={pico_memoria / 1024:.1f}KiB"
+            print(registro)
+            linhas_log.append(registro)
+    executar_varredura_distribuicoes(linhas_log)
+    executar_speedup_paralelo(referencia, linhas_log)
+    executar_benchmarks_numpy(linhas_log, medicoes)
+    operacoes = contar_operacoes_algoritmos(referencia)
+    for nome, contagens in operacoes.items():
+        registro = (
+            f"{nome} | n={INSTRUMENTATION_SIZE} | comparacoes={contagens['comparisons']} | "
+            f"movimentos={instrumentacao.formatar_contagem(contagens['moves'])} | "
+            f"alocacoes={instrumentacao.formatar_contagem(contagens['allocations'])}"
+        )
+        print(registro)
+        linhas_log.append(registro)
+    if os.path.exists(BASELINE_JSON):
+        for nome, tamanho, antes, depois in detectar_regressoes(medicoes, BASELINE_JSON):
+            registro = f"REGRESSAO: {nome} | n={tamanho} | {antes:.4f}s -> {depois:.4f}s"
+            print(registro)
+            linhas_log.append(registro)
+        for nome, metrica, antes, depois in detectar_regressoes_operacoes(operacoes, BASELINE_JSON):
+            registro = f"REGRESSAO: {nome} | {metrica} | {antes} -> {depois}"
             print(registro)
             linhas_log.append(registro)
     salvar_log(linhas_log)
+    salvar_json(medicoes, operacoes)
     salvar_csv(resultados)
     plotar_grafico(
         resultados,
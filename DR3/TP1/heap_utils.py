@@ -1,5 +1,19 @@
 """Funcoes de heap usando max-heap para o trabalho."""
 
+import operator
+from contextlib import ExitStack
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy so e necessario no modo numerico da DaryMaxHeap
+    np = None
+
+# Benchmark da DaryMaxHeap: aridades x tamanhos em uma carga com muitos push/pop.
+DARY_ARITIES = (2, 4, 8)
+DARY_BENCHMARK_SIZES = (10000, 100000)
+
 
 class MaxHeap:
     """Mantem uma heap de maximo usando apenas uma lista Python."""
@@ -39,42 +53,297 @@ class MaxHeap:
         return value in self._values
 
     def _bubble_up(self, index):
-        """Compara o novo elemento com o pai e troca enquanto for maior."""
+        """Sobe o novo elemento abrindo um buraco: cada pai menor desce uma posicao."""
+        _sift_up(self._values, 0, index)
+
+    def _bubble_down(self, index):
+        """Desce pelo metodo de Floyd (ver _heapify_down), que faz metade das comparacoes."""
+        _heapify_down(self._values, index, len(self._values))
+
+
+class IndexedMaxHeap:
+    """Heap de itens com prioridade que guarda a posicao de cada item no vetor.
+
+    O mapa item -> indice da pertinencia em O(1) e permite alterar a prioridade
+    ou remover um item qualquer em O(log n), sem duplicatas na fila.
+    """
+
+    # Ordem da heap: o item cuja prioridade satisfaz _higher(a, b) fica mais perto da raiz.
+    _higher = operator.gt
+
+    def __init__(self):
+        self._items = []
+        self._priorities = []
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def is_empty(self):
+        """Retorna True quando nao ha elementos armazenados."""
+        return not self._items
+
+    def contains(self, item):
+        """Consulta o mapa de posicoes em O(1)."""
+        return item in self._positions
+
+    def priority(self, item):
+        """Retorna a prioridade atual do item."""
+        return self._priorities[self._positions[item]]
+
+    def peek(self):
+        """Retorna (item, prioridade) da raiz sem remover, ou None se vazia."""
+        if not self._items:
+            return None
+        return self._items[0], self._priorities[0]
+
+    def push(self, item, priority):
+        """Insere um item novo no fim e sobe ate a posicao correta."""
+        if item in self._positions:
+            raise ValueError(f"Item ja esta na heap: {item!r}")
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._positions[item] = len(self._items) - 1
+        self._sift_up(len(self._items) - 1)
+
+    def update(self, item, priority):
+        """Troca a prioridade do item e sobe ou desce conforme a nova prioridade."""
+        index = self._positions[item]
+        old_priority = self._priorities[index]
+        self._priorities[index] = priority
+        if self._higher(priority, old_priority):
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def pop(self):
+        """Remove e retorna (item, prioridade) da raiz, ou None se vazia."""
+        if not self._items:
+            return None
+        return self._remove_at(0)
+
+    def remove(self, item):
+        """Remove um item qualquer e retorna a prioridade que ele tinha."""
+        return self._remove_at(self._positions[item])[1]
+
+    def _remove_at(self, index):
+        """Coloca o ultimo elemento no lugar do removido e corrige nas duas direcoes."""
+        items = self._items
+        priorities = self._priorities
+        removed = items[index], priorities[index]
+        del self._positions[removed[0]]
+        last_item = items.pop()
+        last_priority = priorities.pop()
+        if index < len(items):
+            items[index] = last_item
+            priorities[index] = last_priority
+            self._positions[last_item] = index
+            if index > 0 and self._higher(last_priority, priorities[(index - 1) // 2]):
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return removed
+
+    def _sift_up(self, index):
+        """Abre um buraco e desce os pais menos prioritarios ate achar o lugar do item."""
+        items = self._items
+        priorities = self._priorities
+        positions = self._positions
+        higher = self._higher
+        item = items[index]
+        priority = priorities[index]
         while index > 0:
             parent_index = (index - 1) // 2
-            # Se o filho for maior que o pai, troca para levar o maior rumo a raiz.
-            if self._values[index] > self._values[parent_index]:
-                self._values[index], self._values[parent_index] = (
-                    self._values[parent_index],
-                    self._values[index],
-                )
-                index = parent_index
-            else:
+            parent_priority = priorities[parent_index]
+            if not higher(priority, parent_priority):
                 break
-
-    def _bubble_down(self, index):
-        """Compara o elemento com os filhos e troca com o maior deles ate recuperar a propriedade."""
-        size = len(self._values)
+            parent_item = items[parent_index]
+            items[index] = parent_item
+            priorities[index] = parent_priority
+            positions[parent_item] = index
+            index = parent_index
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+    def _sift_down(self, index):
+        """Sobe o filho mais prioritario para o buraco ate o item caber na posicao."""
+        items = self._items
+        priorities = self._priorities
+        positions = self._positions
+        higher = self._higher
+        size = len(items)
+        item = items[index]
+        priority = priorities[index]
         while True:
-            left_child = 2 * index + 1
-            right_child = 2 * index + 2
-            largest = index
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and higher(priorities[child + 1], priorities[child]):
+                child += 1
+            if not higher(priorities[child], priority):
+                break
+            child_item = items[child]
+            items[index] = child_item
+            priorities[index] = priorities[child]
+            positions[child_item] = index
+            index = child
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
 
-            # Checa qual filho possui o maior valor e guarda o indice dele.
-            if left_child < size and self._values[left_child] > self._values[largest]:
-                largest = left_child
 
-            if right_child < size and self._values[right_child] > self._values[largest]:
-                largest = right_child
+class IndexedMinHeap(IndexedMaxHeap):
+    """Mesma heap indexada com a menor prioridade na raiz (Dijkstra, Prim)."""
 
-            if largest != index:
-                self._values[index], self._values[largest] = (
-                    self._values[largest],
-                    self._values[index],
-                )
-                index = largest
+    _higher = operator.lt
+
+
+class DaryMaxHeap:
+    """Max-heap d-aria: cada no tem `arity` filhos e a arvore tem log_d(n) niveis.
+
+    Aridade maior deixa a subida mais barata (menos niveis) e a descida compara mais
+    filhos por nivel, mas eles ficam lado a lado no vetor. Com `numeric=True` os
+    valores ficam num vetor float64 do numpy e o maior filho sai de um argmax.
+    """
+
+    def __init__(self, arity=4, numeric=False, capacity=16):
+        if arity < 2:
+            raise ValueError("A aridade precisa ser pelo menos 2.")
+        if numeric and np is None:
+            raise ImportError("numpy e necessario para DaryMaxHeap(numeric=True).")
+        self.arity = arity
+        self._numeric = numeric
+        self._size = 0
+        self._values = np.empty(max(capacity, 1), dtype=np.float64) if numeric else []
+
+    def __len__(self):
+        return self._size
+
+    def is_empty(self):
+        """Retorna True quando nao ha elementos armazenados."""
+        return self._size == 0
+
+    def peek(self):
+        """Retorna o maior valor sem remover, ou None se vazia."""
+        if self._size == 0:
+            return None
+        return self._values[0]
+
+    def list_values(self):
+        """Retorna uma copia do vetor interno para inspecao."""
+        return list(self._values[:self._size])
+
+    def insert(self, value):
+        """Insere no fim (dobrando o vetor numpy se encheu) e sobe ate a posicao correta."""
+        if self._numeric:
+            if self._size == len(self._values):
+                self._values = np.concatenate((self._values, np.empty_like(self._values)))
+            self._values[self._size] = value
+        else:
+            self._values.append(value)
+        self._size += 1
+        self._sift_up(self._size - 1)
+
+    def remove(self):
+        """Remove o maior valor, leva o ultimo para a raiz e desce ate a posicao correta."""
+        if self._size == 0:
+            return None
+        values = self._values
+        largest_value = values[0]
+        self._size -= 1
+        last_value = values[self._size]
+        if not self._numeric:
+            values.pop()
+        if self._size:
+            values[0] = last_value
+            self._sift_down(0)
+        return largest_value
+
+    def _sift_up(self, index):
+        """Desce os pais menores para o buraco e grava o valor uma vez so no fim."""
+        values = self._values
+        arity = self.arity
+        value = values[index]
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_value = values[parent_index]
+            if value <= parent_value:
+                break
+            values[index] = parent_value
+            index = parent_index
+        values[index] = value
+
+    def _sift_down(self, index):
+        """Sobe o maior dos `arity` filhos para o buraco enquanto ele for maior que o valor."""
+        values = self._values
+        arity = self.arity
+        size = self._size
+        numeric = self._numeric
+        value = values[index]
+        child = index * arity + 1
+        while child < size:
+            if arity == 2:
+                if child + 1 < size and values[child + 1] > values[child]:
+                    child += 1
+                largest_value = values[child]
             else:
+                end = child + arity
+                if end > size:
+                    end = size
+                # O maior filho sai de uma fatia contigua: max/index (ou argmax) rodam em C.
+                block = values[child:end]
+                if numeric:
+                    offset = int(block.argmax())
+                    largest_value = block[offset]
+                else:
+                    largest_value = max(block)
+                    offset = block.index(largest_value)
+                child += offset
+            if largest_value <= value:
                 break
+            values[index] = largest_value
+            index = child
+            child = index * arity + 1
+        values[index] = value
+
+
+def benchmark_dary_heaps(sizes=DARY_BENCHMARK_SIZES, arities=DARY_ARITIES, seed=42):
+    """Mede push n, n trocas (remove + insert) e remove n para cada aridade e tamanho.
+
+    Retorna linhas (tamanho, estrutura, segundos). A MaxHeap binaria original entra
+    como referencia e o modo numpy so aparece quando o numpy esta instalado.
+    """
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        values = [rng.random() for _ in range(2 * size)]
+        structures = [("MaxHeap", MaxHeap)]
+        for arity in arities:
+            structures.append((f"DaryMaxHeap d={arity}", lambda arity=arity: DaryMaxHeap(arity)))
+        if np is not None:
+            for arity in arities:
+                structures.append(
+                    (
+                        f"DaryMaxHeap d={arity} numpy",
+                        lambda arity=arity: DaryMaxHeap(arity, numeric=True, capacity=size),
+                    )
+                )
+        for name, factory in structures:
+            heap = factory()
+            start = time.perf_counter()
+            for value in values[:size]:
+                heap.insert(value)
+            for value in values[size:]:
+                heap.remove()
+                heap.insert(value)
+            while not heap.is_empty():
+                heap.remove()
+            results.append((size, name, time.perf_counter() - start))
+    return results
 
 
 def heapsort(values):
@@ -103,24 +372,39 @@ def _build_max_heap(values, size):
 
 
 def _heapify_down(values, index, size):
-    """Compara um no com os filhos e desce trocando sempre com o maior filho."""
-    while True:
-        left_child = 2 * index + 1
-        right_child = 2 * index + 2
-        largest = index
-
-        if left_child < size and values[left_child] > values[largest]:
-            largest = left_child
-
-        if right_child < size and values[right_child] > values[largest]:
-            largest = right_child
-
-        if largest != index:
-            # Troca o pai com o maior filho e continua a checagem na nova posicao.
-            values[index], values[largest] = values[largest], values[index]
-            index = largest
-        else:
+    """Desce pelo metodo de Floyd: leva o buraco ate uma folha e depois sobe o valor.
+
+    Na descida so o maior dos dois filhos e escolhido (uma comparacao por nivel, sem
+    comparar com o valor que desce). Como o valor que veio do fim da heap costuma
+    ser pequeno, a subida final para logo e o total fica perto da metade do metodo
+    classico, que faz duas comparacoes por nivel.
+    """
+    start = index
+    value = values[index]
+    child = 2 * index + 1
+    while child < size:
+        right_child = child + 1
+        if right_child < size and values[right_child] > values[child]:
+            child = right_child
+        # O maior filho sobe para o buraco; cada nivel faz uma escrita so.
+        values[index] = values[child]
+        index = child
+        child = 2 * index + 1
+    values[index] = value
+    _sift_up(values, start, index)
+
+
+def _sift_up(values, start, index):
+    """Sobe values[index] ate no maximo a posicao start, descendo os pais menores."""
+    value = values[index]
+    while index > start:
+        parent_index = (index - 1) // 2
+        parent_value = values[parent_index]
+        if not value > parent_value:
             break
+        values[index] = parent_value
+        index = parent_index
+    values[index] = value
 
 
 def merge_sorted_lists(sorted_lists):
@@ -153,3 +437,73 @@ def merge_sorted_lists(sorted_lists):
     result_desc.reverse()
     return result_desc
 
+
+def merge_sorted_iterables(iterables, key=None):
+    """Intercala iteraveis ordenados de forma preguicosa com uma min-heap de cabecas.
+
+    A heap guarda so o elemento atual de cada fonte como (chave, fonte, valor), entao a
+    memoria e O(k) para k fontes e cada valor sai em O(log k). O indice da fonte
+    desempata chaves iguais, mantendo a ordem das fontes (intercalacao estavel) sem
+    nunca comparar os valores em si.
+    """
+    heads = []
+    sources = []
+    for iterable in iterables:
+        iterator = iter(iterable)
+        for value in iterator:
+            heads.append((value if key is None else key(value), len(sources), value))
+            sources.append(iterator)
+            break
+
+    for index in range(len(heads) // 2 - 1, -1, -1):
+        _min_heapify_down(heads, index, len(heads))
+
+    while heads:
+        _, source, value = heads[0]
+        yield value
+        # Troca a raiz pelo proximo elemento da mesma fonte; fonte esgotada sai da heap.
+        for next_value in sources[source]:
+            heads[0] = (next_value if key is None else key(next_value), source, next_value)
+            break
+        else:
+            sources[source] = None
+            last = heads.pop()
+            if not heads:
+                break
+            heads[0] = last
+        _min_heapify_down(heads, 0, len(heads))
+
+
+def merge_sorted_files(paths, key=None):
+    """Intercala arquivos de texto ja ordenados linha a linha, sem carrega-los na memoria.
+
+    Gera as linhas sem a quebra de linha final ("\\n" ou "\\r\\n"); `key` recebe a
+    linha (ex.: int para numeros).
+    Os arquivos ficam abertos enquanto o gerador e consumido e sao fechados ao fim.
+    """
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, "r", encoding="utf-8")) for path in paths]
+        lines = ((line.rstrip("\r\n") for line in file) for file in files)
+        yield from merge_sorted_iterables(lines, key)
+
+
+def _min_heapify_down(values, index, size):
+    """Versao de minimo do _heapify_down (Floyd) usada pela intercalacao."""
+    start = index
+    value = values[index]
+    child = 2 * index + 1
+    while child < size:
+        right_child = child + 1
+        if right_child < size and values[right_child] < values[child]:
+            child = right_child
+        values[index] = values[child]
+        index = child
+        child = 2 * index + 1
+    while index > start:
+        parent_index = (index - 1) // 2
+        parent_value = values[parent_index]
+        if not value < parent_value:
+            break
+        values[index] = parent_value
+        index = parent_index
+    values[index] = value
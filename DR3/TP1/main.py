@@ -1,4 +1,13 @@
-from heap_utils import MaxHeap, merge_sorted_lists, heapsort
+import itertools
+
+from heap_utils import (
+    IndexedMaxHeap,
+    MaxHeap,
+    benchmark_dary_heaps,
+    heapsort,
+    merge_sorted_iterables,
+    merge_sorted_lists,
+)
 
 
 def demonstrate_heap_operations() -> None:
@@ -25,6 +34,22 @@ def demonstrate_heap_operations() -> None:
     print(f"Heap esta vazia? {heap.is_empty()}")
 
 
+def demonstrate_indexed_heap() -> None:
+    """Altera prioridades e remove um item do meio usando o mapa de posicoes."""
+    print("\n=== Demonstracao da heap indexada ===")
+    heap = IndexedMaxHeap()
+    for task, priority in [("backup", 3), ("deploy", 7), ("email", 1), ("report", 5)]:
+        heap.push(task, priority)
+    print(f"Contem 'email'? {heap.contains('email')}")
+    heap.update("email", 9)
+    print(f"Apos aumentar a prioridade de 'email' para 9, a raiz e: {heap.peek()}")
+    print(f"Prioridade removida de 'deploy': {heap.remove('deploy')}")
+    order = []
+    while not heap.is_empty():
+        order.append(heap.pop())
+    print(f"Ordem de saida: {order}")
+
+
 def demonstrate_heapsort() -> None:
     """Aplica o HeapSort na lista exemplo e mostra antes e depois."""
     print("\n=== Demonstracao do HeapSort ===")
@@ -47,7 +72,30 @@ def demonstrate_merge_sorted_lists() -> None:
     print(f"Lista final combinada: {merged}")
 
 
+def demonstrate_streaming_merge() -> None:
+    """Intercala fontes sem fim com a min-heap de cabecas, consumindo so o necessario."""
+    print("\n=== Demonstracao da intercalacao preguicosa com min-heap ===")
+    multiples_of_three = itertools.count(0, 3)
+    multiples_of_five = itertools.count(0, 5)
+    words = ["abacate", "Banana", "caju"]
+    merged = merge_sorted_iterables([multiples_of_three, multiples_of_five])
+    first_values = list(itertools.islice(merged, 10))
+    print(f"Primeiros 10 valores dos multiplos de 3 e de 5 (fontes infinitas): {first_values}")
+    merged_words = list(merge_sorted_iterables([words, ["Amora", "cereja"]], key=str.lower))
+    print(f"Palavras intercaladas ignorando maiusculas: {merged_words}")
+
+
+def demonstrate_dary_heap_benchmark() -> None:
+    """Compara a MaxHeap binaria com heaps d-arias numa carga de muitos push/pop."""
+    print("\n=== Benchmark de aridade x tamanho da heap ===")
+    for size, name, seconds in benchmark_dary_heaps():
+        print(f"n={size:<7} {name:<26} {seconds:.4f}s")
+
+
 if __name__ == "__main__":
     demonstrate_heap_operations()
+    demonstrate_indexed_heap()
     demonstrate_heapsort()
     demonstrate_merge_sorted_lists()
+    demonstrate_streaming_merge()
+    demonstrate_dary_heap_benchmark()
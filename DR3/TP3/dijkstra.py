@@ -1,6 +1,23 @@
-import heapq
+import importlib.util
+import os
 from collections import defaultdict
 
+
+def carregar_modulo(nome, caminho):
+    # Importa um arquivo .py de outra pasta do repositorio pelo caminho, sem mexer
+    # no sys.path de quem chamou.
+    especificacao = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+# A fila de prioridades indexada fica no heap_utils do TP1.
+IndexedMinHeap = carregar_modulo(
+    "heap_utils",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "TP1", "heap_utils.py"),
+).IndexedMinHeap
+
 # Arestas com pesos (distancias) conforme o desenho do grafo.
 # Sinta-se livre para ajustar valores se precisar seguir outra fonte.
 EDGES = [
@@ -46,20 +63,23 @@ def dijkstra(graph, start, goal):
     """Retorna (distancia, caminho) ou (None, None) se nao houver caminho."""
     distances = {start: 0}
     predecessors = {start: None}
-    priority_queue = [(0, start)]  # (distancia acumulada, cidade)
+    # Fila indexada: cada cidade aparece uma vez e tem a distancia reduzida no lugar.
+    priority_queue = IndexedMinHeap()
+    priority_queue.push(start, 0)
 
     while priority_queue:
-        current_distance, current_city = heapq.heappop(priority_queue)
+        current_city, current_distance = priority_queue.pop()
         if current_city == goal:
             break
-        if current_distance != distances.get(current_city, float("inf")):
-            continue
         for neighbor_city, edge_distance in graph[current_city]:
             candidate_distance = current_distance + edge_distance
             if candidate_distance < distances.get(neighbor_city, float("inf")):
                 distances[neighbor_city] = candidate_distance
                 predecessors[neighbor_city] = current_city
-                heapq.heappush(priority_queue, (candidate_distance, neighbor_city))
+                if neighbor_city in priority_queue:
+                    priority_queue.update(neighbor_city, candidate_distance)
+                else:
+                    priority_queue.push(neighbor_city, candidate_distance)
     else:
         return None, None
 
@@ -1,4 +1,47 @@
+import heapq
+import importlib.util
+import math
+import os
+import random
+import re
+import sys
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+def carregar_modulo(nome, caminho):
+    # Importa um arquivo .py de outra pasta do repositorio pelo caminho, sem mexer
+    # no sys.path de quem chamou.
+    especificacao = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+# O gerador de distribuicoes fica junto do benchmark de ordenacao do DR1.
+geradores_entrada = carregar_modulo(
+    "geradores_entrada",
+    Path(__file__).resolve().parents[2] / "DR1" / "AT" / "geradores_entrada.py",
+)
+
+WORKERS_PARALELO = [1, 2, 4, 8]
+# O speedup divide a entrada sempre no mesmo numero de blocos e varia so a
+# quantidade de processos: assim o ganho vem do paralelismo, e nao de ordenar
+# blocos menores com um algoritmo O(n^2).
+BLOCOS_SPEEDUP = max(WORKERS_PARALELO)
+# A listagem_completa.txt ja esta em ordem; o speedup usa uma copia embaralhada
+# com esta seed para o Insertion Sort sequencial nao virar O(n).
+SEED_SPEEDUP = 42
+
+PADRAO_NUMEROS = re.compile(r"(\d+)")
+
+# Ordenacao externa: memoria maxima por run, quantos runs cada passada intercala
+# e o buffer de leitura/escrita de cada arquivo temporario.
+MEMORIA_RUN_BYTES = 64 * 1024 * 1024
+FAN_IN_PADRAO = 64
+BUFFER_ARQUIVO_BYTES = 1024 * 1024
+TAMANHOS_DISTRIBUICOES = [100, 1000, 5000]
 
 def bubble_sort(arr):
     n = len(arr)
@@ -37,11 +80,203 @@ def insertion_sort(arr):
     return arr
 
 
+def chave_natural(nome):
+    # "arquivo_10.txt" -> ("arquivo_", 10, ".txt"): trechos numericos comparam
+    # como inteiros. O split sempre comeca por texto, entao os tipos se alternam
+    # na mesma posicao de todas as chaves e a comparacao de tuplas e segura.
+    partes = PADRAO_NUMEROS.split(nome)
+    for i in range(1, len(partes), 2):
+        partes[i] = int(partes[i])
+    return tuple(partes)
+
+def extrair_chaves(nomes):
+    # Calcula a chave de cada nome uma unica vez. Quando todos os nomes seguem o
+    # mesmo molde texto+numero+texto (ex.: arquivo_N.txt), a chave vira so o int.
+    chaves = [chave_natural(nome) for nome in nomes]
+    if chaves and all(len(c) == 3 for c in chaves):
+        prefixo, _, sufixo = chaves[0]
+        if all(c[0] == prefixo and c[2] == sufixo for c in chaves):
+            return [c[1] for c in chaves]
+    return chaves
+
+def ordenar_natural(func, nomes):
+    # Decorate-sort-undecorate: ordena pares (chave, posicao) com `func` e depois
+    # recupera os nomes. A posicao desempata sem comparar as strings originais.
+    decorados = list(zip(extrair_chaves(nomes), range(len(nomes))))
+    ordenados = func(decorados)
+    return [nomes[posicao] for _, posicao in ordenados]
+
+class _NomeNatural:
+    # Comparacao natural recalculando a chave a cada comparacao (referencia
+    # para medir o ganho das chaves pre-calculadas).
+    __slots__ = ("nome",)
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __lt__(self, outro):
+        return chave_natural(self.nome) < chave_natural(outro.nome)
+
+    def __gt__(self, outro):
+        return chave_natural(self.nome) > chave_natural(outro.nome)
+
+def medir_chaves_naturais(func, nomes):
+    # Compara ordenar strings cruas, ordem natural recalculando a chave em cada
+    # comparacao e ordem natural com chaves pre-calculadas (tupla e int).
+    registros = []
+    _, t = medir_tempo(func, nomes)
+    registros.append(("lexicografica (strings)", t))
+    _, t = medir_tempo(lambda copia: func([_NomeNatural(n) for n in copia]), nomes)
+    registros.append(("natural, chave por comparacao", t))
+    _, t = medir_tempo(
+        lambda copia: func([(chave_natural(n), i) for i, n in enumerate(copia)]), nomes
+    )
+    registros.append(("natural, chave tupla pre-calculada", t))
+    _, t = medir_tempo(lambda copia: ordenar_natural(func, copia), nomes)
+    registros.append(("natural, chave compacta pre-calculada", t))
+    return registros
+
+def _ordenar_trecho_compartilhado(func, nome_memoria, inicio, fim):
+    # Roda no processo filho: le as linhas do trecho na memoria compartilhada,
+    # ordena e regrava no mesmo intervalo de bytes (mesmo tamanho total).
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        linhas = bytes(memoria.buf[inicio:fim]).decode("utf-8").split("\n")
+        ordenado = func(linhas)
+        memoria.buf[inicio:fim] = "\n".join(ordenado).encode("utf-8")
+    finally:
+        memoria.close()
+
+def ordenar_paralelo(func, arr, workers=None, blocos=None):
+    # Divide a lista em `blocos` partes (padrao: uma por processo), ordena cada
+    # bloco com `func` num ProcessPoolExecutor de `workers` processos e junta
+    # tudo com uma intercalacao k-way em heap.
+    # As linhas trafegam por memoria compartilhada em vez de serem serializadas,
+    # separadas por "\n": por isso so aceita str sem quebra de linha.
+    for linha in arr:
+        if not isinstance(linha, str):
+            raise TypeError(f"ordenar_paralelo aceita apenas str, recebeu {type(linha).__name__}")
+        if "\n" in linha:
+            raise ValueError(f"Item com quebra de linha nao pode ser ordenado em paralelo: {linha!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if blocos is None:
+        blocos = workers
+    if len(arr) < 2:
+        return arr
+    total = len(arr)
+    blocos = max(1, min(blocos, total))
+    codificadas = [linha.encode("utf-8") for linha in arr]
+    limites = []
+    inicio_linha = 0
+    inicio_byte = 0
+    for i in range(blocos):
+        fim_linha = (i + 1) * total // blocos
+        bloco = codificadas[inicio_linha:fim_linha]
+        fim_byte = inicio_byte + sum(len(b) for b in bloco) + len(bloco) - 1
+        limites.append((inicio_byte, fim_byte))
+        inicio_linha = fim_linha
+        inicio_byte = fim_byte + 1
+
+    conteudo = b"\n".join(codificadas)
+    memoria = shared_memory.SharedMemory(create=True, size=max(1, len(conteudo)))
+    try:
+        memoria.buf[:len(conteudo)] = conteudo
+        with ProcessPoolExecutor(max_workers=min(workers, blocos)) as executor:
+            futures = [
+                executor.submit(_ordenar_trecho_compartilhado, func, memoria.name, inicio, fim)
+                for inicio, fim in limites
+            ]
+            for futuro in futures:
+                futuro.result()
+        blocos = [
+            bytes(memoria.buf[inicio:fim]).decode("utf-8").split("\n")
+            for inicio, fim in limites
+        ]
+    finally:
+        memoria.close()
+        memoria.unlink()
+    arr[:] = heapq.merge(*blocos)
+    return arr
 
 def carregar_listagem(caminho):
     with open(caminho, "r", encoding="utf-8") as f:
         return [linha.strip() for linha in f if linha.strip()]
 
+def _gravar_run(linhas, pasta, indice, buffer_bytes):
+    caminho = os.path.join(pasta, f"run_{indice:06d}.txt")
+    with open(caminho, "w", encoding="utf-8", buffering=buffer_bytes) as f:
+        for linha in linhas:
+            f.write(linha + "\n")
+    return caminho
+
+def _ler_run(caminho, buffer_bytes):
+    with open(caminho, "r", encoding="utf-8", buffering=buffer_bytes) as f:
+        for linha in f:
+            yield linha.rstrip("\n")
+
+def _gerar_runs(caminho, pasta, memoria_bytes, buffer_bytes):
+    # Le a entrada em streaming e grava um run ordenado sempre que o bloco
+    # em memoria atinge o limite configurado.
+    runs = []
+    bloco = []
+    ocupado = 0
+    with open(caminho, "r", encoding="utf-8", buffering=buffer_bytes) as f:
+        for linha in f:
+            linha = linha.strip()
+            if not linha:
+                continue
+            bloco.append(linha)
+            ocupado += sys.getsizeof(linha) + 8
+            if ocupado >= memoria_bytes:
+                bloco.sort()
+                runs.append(_gravar_run(bloco, pasta, len(runs), buffer_bytes))
+                bloco = []
+                ocupado = 0
+    if bloco or not runs:
+        bloco.sort()
+        runs.append(_gravar_run(bloco, pasta, len(runs), buffer_bytes))
+    return runs
+
+def ordenar_externo(
+    entrada,
+    saida,
+    memoria_bytes=MEMORIA_RUN_BYTES,
+    fan_in=FAN_IN_PADRAO,
+    passadas=None,
+    buffer_bytes=BUFFER_ARQUIVO_BYTES,
+):
+    # Ordena um arquivo maior que a RAM: runs ordenados em arquivos temporarios
+    # e intercalacao k-way com heap. `fan_in` limita quantos runs sao abertos por
+    # intercalacao; se `passadas` for informado, o fan-in e calculado para
+    # terminar nesse numero de passadas. Devolve (quantidade de runs, passadas).
+    with tempfile.TemporaryDirectory(prefix="ordenacao_externa_") as pasta:
+        runs = _gerar_runs(entrada, pasta, memoria_bytes, buffer_bytes)
+        total_runs = len(runs)
+        if passadas is not None:
+            fan_in = math.ceil(total_runs ** (1 / max(1, passadas)))
+        fan_in = max(2, fan_in)
+
+        proximo_indice = total_runs
+        passadas_feitas = 0
+        while len(runs) > fan_in:
+            proximos = []
+            for inicio in range(0, len(runs), fan_in):
+                grupo = runs[inicio:inicio + fan_in]
+                intercalado = heapq.merge(*(_ler_run(c, buffer_bytes) for c in grupo))
+                proximos.append(_gravar_run(intercalado, pasta, proximo_indice, buffer_bytes))
+                proximo_indice += 1
+                for caminho in grupo:
+                    os.remove(caminho)
+            runs = proximos
+            passadas_feitas += 1
+
+        with open(saida, "w", encoding="utf-8", buffering=buffer_bytes) as f:
+            for linha in heapq.merge(*(_ler_run(c, buffer_bytes) for c in runs)):
+                f.write(linha + "\n")
+        passadas_feitas += 1
+    return total_runs, passadas_feitas
+
 def medir_tempo(func, dados):
     copia = list(dados)
     inicio = time.perf_counter()
@@ -49,6 +284,31 @@ def medir_tempo(func, dados):
     duracao = time.perf_counter() - inicio
     return ordenado, duracao
 
+def medir_speedup_paralelo(func, dados):
+    # Speedup de cada quantidade de processos sobre a execucao com 1 processo,
+    # todas com BLOCOS_SPEEDUP blocos.
+    registros = []
+    for workers in WORKERS_PARALELO:
+        if workers > (os.cpu_count() or 1):
+            break
+        _, duracao = medir_tempo(
+            lambda copia: ordenar_paralelo(func, copia, workers, BLOCOS_SPEEDUP), dados
+        )
+        base = registros[0][1] if registros else duracao
+        registros.append((workers, duracao, base / duracao))
+    return registros
+
+def medir_distribuicoes(algoritmos, tamanhos):
+    # Varre algoritmos x distribuicoes x tamanhos usando entradas com seed fixo.
+    registros = []
+    for distribuicao in geradores_entrada.DISTRIBUICOES:
+        for tamanho in tamanhos:
+            dados = geradores_entrada.gerar(distribuicao, tamanho)
+            for nome_alg, func in algoritmos:
+                _, duracao = medir_tempo(func, dados)
+                registros.append((f"{nome_alg} | {distribuicao} | n={tamanho}", duracao))
+    return registros
+
 def salvar_tempos(registros, caminho):
     with open(caminho, "w", encoding="utf-8") as f:
         for nome_alg, t in registros:
@@ -57,6 +317,9 @@ def salvar_tempos(registros, caminho):
 if __name__ == "__main__":
     LIST_FILE = "listagem_completa.txt"
     OUT_LOG = "tempos_ordenacao_sort.txt"
+    OUT_DISTRIBUICOES = "tempos_distribuicoes.txt"
+    OUT_EXTERNO = "listagem_ordenada_externa.txt"
+    OUT_CHAVES = "tempos_chaves_naturais.txt"
 
     arquivos = carregar_listagem(LIST_FILE)
 
@@ -71,8 +334,45 @@ if __name__ == "__main__":
     ordenado_insertion, t_insertion = medir_tempo(insertion_sort, arquivos)
     resultados.append(("Insertion Sort", t_insertion))
 
+    # Modo paralelo: Insertion Sort em BLOCOS_SPEEDUP blocos + intercalacao k-way,
+    # variando so os processos; o sequencial sobre a mesma entrada embaralhada
+    # fica registrado ao lado para comparacao.
+    embaralhados = arquivos[:]
+    random.Random(SEED_SPEEDUP).shuffle(embaralhados)
+    _, t_insertion_embaralhado = medir_tempo(insertion_sort, embaralhados)
+    resultados.append(("Insertion Sort (entrada embaralhada)", t_insertion_embaralhado))
+    speedups = medir_speedup_paralelo(insertion_sort, embaralhados)
+    for workers, t, _ in speedups:
+        resultados.append((f"Insertion Sort paralelo ({workers} workers, {BLOCOS_SPEEDUP} blocos)", t))
+
+    # Modo externo: memoria pequena de proposito para gerar varios runs e passadas.
+    inicio = time.perf_counter()
+    total_runs, passadas = ordenar_externo(LIST_FILE, OUT_EXTERNO, memoria_bytes=64 * 1024, fan_in=4)
+    t_externo = time.perf_counter() - inicio
+    resultados.append((f"Ordenacao externa ({total_runs} runs, {passadas} passadas)", t_externo))
+
     salvar_tempos(resultados, OUT_LOG)
     print("\nTempos de execução:")
     for nome_alg, t in resultados:
         print(f"{nome_alg}: {t:.6f} s")
+    print(
+        f"\nSpeedup do modo paralelo sobre 1 processo ({BLOCOS_SPEEDUP} blocos, entrada embaralhada):"
+    )
+    for workers, t, speedup in speedups:
+        print(f"{workers} workers: {speedup:.2f}x " + "#" * round(speedup))
     print(f"\nTempos também salvos em: {OUT_LOG}")
+
+    registros_chaves = medir_chaves_naturais(insertion_sort, arquivos)
+    salvar_tempos(registros_chaves, OUT_CHAVES)
+    print("\nInsertion Sort em ordem natural (arquivo_2 antes de arquivo_10):")
+    for nome_alg, t in registros_chaves:
+        print(f"{nome_alg}: {t:.6f} s")
+    print(f"Tempos das chaves naturais salvos em: {OUT_CHAVES}")
+
+    algoritmos = [
+        ("Bubble Sort", bubble_sort),
+        ("Selection Sort", selection_sort),
+        ("Insertion Sort", insertion_sort),
+    ]
+    salvar_tempos(medir_distribuicoes(algoritmos, TAMANHOS_DISTRIBUICOES), OUT_DISTRIBUICOES)
+    print(f"Tempos por distribuição salvos em: {OUT_DISTRIBUICOES}")
@@ -3,6 +3,9 @@
 
 # (a) Classe para nós da árvore binária com operações básicas.
 class TreeNode:
+    # __slots__ evita um __dict__ por nó, reduzindo a memória de árvores grandes.
+    __slots__ = ("valor", "esquerda", "direita")
+
     def __init__(self, valor):
         self.valor = valor
         self.esquerda = None
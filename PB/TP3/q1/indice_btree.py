@@ -0,0 +1,316 @@
+import mmap
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+# Layout do arquivo: pagina 0 e o cabecalho; as demais sao nos da B+tree.
+# Cabecalho: magic, tamanho da pagina, pagina raiz, total de paginas, total de chaves
+# e o mtime (ns) e o tamanho do arquivo de dados de onde o indice foi montado.
+CABECALHO = struct.Struct("<4sIIIIqq")
+MAGIC = b"BPT2"
+# No: tipo (0 = folha, 1 = interno), quantidade de chaves, proxima folha (0 = nenhuma).
+CABECALHO_NO = struct.Struct("<BHI")
+PONTEIRO = struct.Struct("<I")
+TAMANHO_CHAVE = struct.Struct("<H")
+FOLHA = 0
+INTERNO = 1
+TAMANHO_PAGINA_PADRAO = 4096
+
+
+class BPlusTree:
+    """B+tree de strings persistida em paginas de um arquivo mapeado em memoria.
+
+    Usa os mesmos nomes de metodo da BinaryTree. Remocoes apenas tiram a chave
+    da folha (sem fundir paginas): os separadores continuam validos para guiar
+    a busca e as folhas vazias sao puladas pelo encadeamento.
+    """
+
+    def __init__(self, caminho: Path, tamanho_pagina: int = TAMANHO_PAGINA_PADRAO):
+        self.caminho = Path(caminho)
+        novo = not self.caminho.exists() or self.caminho.stat().st_size == 0
+        self._arquivo = self.caminho.open("w+b" if novo else "r+b")
+        if novo:
+            self._arquivo.truncate(2 * tamanho_pagina)
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0)
+        if novo:
+            self.tamanho_pagina = tamanho_pagina
+            self._raiz = 1
+            self._total_paginas = 2
+            self._total_chaves = 0
+            self.origem = (0, 0)
+            self._gravar_no(1, FOLHA, [], [], 0)
+            self._gravar_cabecalho()
+        else:
+            magic, pagina, raiz, paginas, chaves, mtime, tamanho = CABECALHO.unpack_from(
+                self._mapa, 0
+            )
+            if magic != MAGIC:
+                self._mapa.close()
+                self._arquivo.close()
+                raise ValueError(f"Arquivo nao e um indice B+tree: {self.caminho}")
+            self.tamanho_pagina = pagina
+            self._raiz = raiz
+            self._total_paginas = paginas
+            self._total_chaves = chaves
+            self.origem = (mtime, tamanho)
+        # Com chaves de ate 1/4 da pagina, o corte por bytes de _ponto_de_divisao sempre
+        # deixa as duas metades de um no estourado dentro de uma pagina.
+        self.maximo_bytes_chave = (
+            self.tamanho_pagina - CABECALHO_NO.size - 5 * PONTEIRO.size
+        ) // 4 - TAMANHO_CHAVE.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Grava o cabecalho e libera o mapeamento."""
+        if self._mapa.closed:
+            return
+        self._gravar_cabecalho()
+        self._mapa.flush()
+        self._mapa.close()
+        self._arquivo.close()
+
+    def _gravar_cabecalho(self) -> None:
+        CABECALHO.pack_into(
+            self._mapa,
+            0,
+            MAGIC,
+            self.tamanho_pagina,
+            self._raiz,
+            self._total_paginas,
+            self._total_chaves,
+            *self.origem,
+        )
+
+    def _ler_no(self, pagina: int):
+        """Decodifica a pagina em (tipo, chaves, filhos, proxima folha)."""
+        mapa = self._mapa
+        posicao = pagina * self.tamanho_pagina
+        tipo, quantidade, proxima = CABECALHO_NO.unpack_from(mapa, posicao)
+        posicao += CABECALHO_NO.size
+        filhos = []
+        if tipo == INTERNO:
+            filhos = list(struct.unpack_from(f"<{quantidade + 1}I", mapa, posicao))
+            posicao += (quantidade + 1) * PONTEIRO.size
+        chaves = []
+        for _ in range(quantidade):
+            (tamanho,) = TAMANHO_CHAVE.unpack_from(mapa, posicao)
+            posicao += TAMANHO_CHAVE.size
+            chaves.append(mapa[posicao:posicao + tamanho].decode("utf-8"))
+            posicao += tamanho
+        return tipo, chaves, filhos, proxima
+
+    def _bytes_no(self, chaves, filhos) -> int:
+        total = CABECALHO_NO.size + len(filhos) * PONTEIRO.size
+        for chave in chaves:
+            total += TAMANHO_CHAVE.size + len(chave.encode("utf-8"))
+        return total
+
+    def _gravar_no(self, pagina: int, tipo: int, chaves, filhos, proxima: int) -> None:
+        partes = [CABECALHO_NO.pack(tipo, len(chaves), proxima)]
+        if tipo == INTERNO:
+            partes.append(struct.pack(f"<{len(filhos)}I", *filhos))
+        for chave in chaves:
+            codificada = chave.encode("utf-8")
+            partes.append(TAMANHO_CHAVE.pack(len(codificada)))
+            partes.append(codificada)
+        dados = b"".join(partes)
+        assert len(dados) <= self.tamanho_pagina, "no maior que a pagina"
+        inicio = pagina * self.tamanho_pagina
+        self._mapa[inicio:inicio + len(dados)] = dados
+
+    def _ponto_de_divisao(self, chaves, interno: bool) -> int:
+        """Escolhe o corte que equilibra os bytes das duas metades de um no estourado.
+
+        Na folha o corte `meio` separa chaves[:meio] e chaves[meio:]; no interno
+        chaves[meio] sobe para o pai e cada lado leva um ponteiro a mais que chaves.
+        """
+        tamanhos = [TAMANHO_CHAVE.size + len(chave.encode("utf-8")) for chave in chaves]
+        total = sum(tamanhos)
+        melhor = None
+        melhor_maior = None
+        esquerda = 0
+        for meio in range(1, len(chaves) - interno):
+            esquerda += tamanhos[meio - 1]
+            if interno:
+                direita = total - esquerda - tamanhos[meio]
+                bytes_esquerda = esquerda + (meio + 1) * PONTEIRO.size
+                bytes_direita = direita + (len(chaves) - meio) * PONTEIRO.size
+            else:
+                bytes_esquerda = esquerda
+                bytes_direita = total - esquerda
+            maior = max(bytes_esquerda, bytes_direita)
+            if melhor_maior is None or maior < melhor_maior:
+                melhor = meio
+                melhor_maior = maior
+        return melhor
+
+    def _alocar_pagina(self) -> int:
+        """Reserva uma pagina nova, dobrando o arquivo quando o mapeamento acaba."""
+        pagina = self._total_paginas
+        self._total_paginas += 1
+        necessario = self._total_paginas * self.tamanho_pagina
+        tamanho_atual = len(self._mapa)
+        if necessario > tamanho_atual:
+            self._mapa.flush()
+            self._mapa.close()
+            self._arquivo.truncate(max(necessario, 2 * tamanho_atual))
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0)
+        return pagina
+
+    def _folha_para(self, valor: str, busca) -> int:
+        """Desce da raiz ate a folha; `busca` escolhe bisect_left ou bisect_right."""
+        pagina = self._raiz
+        while True:
+            tipo, chaves, filhos, _ = self._ler_no(pagina)
+            if tipo == FOLHA:
+                return pagina
+            pagina = filhos[busca(chaves, valor)]
+
+    def _primeiro_maior_ou_igual(self, valor: str):
+        """Devolve (pagina, indice, chaves) do primeiro valor >= `valor`, ou None."""
+        pagina = self._folha_para(valor, bisect_left)
+        while pagina:
+            _, chaves, _, proxima = self._ler_no(pagina)
+            indice = bisect_left(chaves, valor)
+            if indice < len(chaves):
+                return pagina, indice, chaves
+            pagina = proxima
+        return None
+
+    def inserir(self, valor: str) -> None:
+        """Insere o valor na folha correta e divide as paginas que estourarem."""
+        if len(valor.encode("utf-8")) > self.maximo_bytes_chave:
+            raise ValueError(f"Chave maior que {self.maximo_bytes_chave} bytes: {valor!r}")
+        caminho = []
+        pagina = self._raiz
+        while True:
+            tipo, chaves, filhos, proxima = self._ler_no(pagina)
+            if tipo == FOLHA:
+                break
+            caminho.append((pagina, chaves, filhos))
+            pagina = filhos[bisect_right(chaves, valor)]
+
+        chaves.insert(bisect_right(chaves, valor), valor)
+        self._total_chaves += 1
+        if self._bytes_no(chaves, []) <= self.tamanho_pagina:
+            self._gravar_no(pagina, FOLHA, chaves, [], proxima)
+            return
+
+        # Split da folha: a metade direita vai para uma pagina nova encadeada.
+        meio = self._ponto_de_divisao(chaves, interno=False)
+        nova = self._alocar_pagina()
+        self._gravar_no(nova, FOLHA, chaves[meio:], [], proxima)
+        self._gravar_no(pagina, FOLHA, chaves[:meio], [], nova)
+        separador = chaves[meio]
+        filho_direito = nova
+
+        while caminho:
+            pagina, chaves, filhos = caminho.pop()
+            indice = bisect_right(chaves, separador)
+            chaves.insert(indice, separador)
+            filhos.insert(indice + 1, filho_direito)
+            if self._bytes_no(chaves, filhos) <= self.tamanho_pagina:
+                self._gravar_no(pagina, INTERNO, chaves, filhos, 0)
+                return
+            # Split do no interno: a chave do corte sobe para o pai.
+            meio = self._ponto_de_divisao(chaves, interno=True)
+            separador = chaves[meio]
+            nova = self._alocar_pagina()
+            self._gravar_no(nova, INTERNO, chaves[meio + 1:], filhos[meio + 1:], 0)
+            self._gravar_no(pagina, INTERNO, chaves[:meio], filhos[:meio + 1], 0)
+            filho_direito = nova
+
+        # A raiz dividiu: a arvore ganha um nivel.
+        nova_raiz = self._alocar_pagina()
+        self._gravar_no(nova_raiz, INTERNO, [separador], [self._raiz, filho_direito], 0)
+        self._raiz = nova_raiz
+
+    def inserir_varios(self, valores) -> float:
+        """Insere uma colecao de valores e devolve o tempo total."""
+        inicio = time.perf_counter()
+        for valor in valores:
+            self.inserir(valor)
+        self._gravar_cabecalho()
+        return time.perf_counter() - inicio
+
+    def buscar(self, valor: str):
+        """Devolve o valor se ele estiver no indice, senao None."""
+        encontrado = self._primeiro_maior_ou_igual(valor)
+        if encontrado is not None:
+            _, indice, chaves = encontrado
+            if chaves[indice] == valor:
+                return valor
+        return None
+
+    def buscar_primeiro_por_prefixo(self, prefixo: str):
+        """Localiza o menor valor >= prefixo e confere se ele tem o prefixo."""
+        encontrado = self._primeiro_maior_ou_igual(prefixo)
+        if encontrado is not None:
+            _, indice, chaves = encontrado
+            if chaves[indice].startswith(prefixo):
+                return chaves[indice]
+        return None
+
+    def iterar_por_prefixo(self, prefixo: str):
+        """Gera em ordem os valores com o prefixo seguindo o encadeamento das folhas."""
+        encontrado = self._primeiro_maior_ou_igual(prefixo)
+        if encontrado is None:
+            return
+        pagina, indice, chaves = encontrado
+        while True:
+            for chave in chaves[indice:]:
+                if not chave.startswith(prefixo):
+                    return
+                yield chave
+            _, _, _, pagina = self._ler_no(pagina)
+            if not pagina:
+                return
+            _, chaves, _, _ = self._ler_no(pagina)
+            indice = 0
+
+    def contar_por_prefixo(self, prefixo: str) -> int:
+        """Conta os valores com o prefixo percorrendo apenas as folhas do intervalo."""
+        return sum(1 for _ in self.iterar_por_prefixo(prefixo))
+
+    def remover(self, valor: str) -> bool:
+        """Remove uma ocorrencia do valor, se existir."""
+        encontrado = self._primeiro_maior_ou_igual(valor)
+        if encontrado is None:
+            return False
+        pagina, indice, chaves = encontrado
+        if chaves[indice] != valor:
+            return False
+        _, _, _, proxima = self._ler_no(pagina)
+        del chaves[indice]
+        self._gravar_no(pagina, FOLHA, chaves, [], proxima)
+        self._total_chaves -= 1
+        return True
+
+    def remover_primeiro_por_prefixo(self, prefixo: str):
+        """Localiza e remove o primeiro valor com o prefixo indicado."""
+        alvo = self.buscar_primeiro_por_prefixo(prefixo)
+        if alvo is None:
+            return False, None
+        removido = self.remover(alvo)
+        return removido, alvo if removido else None
+
+    def contar_nos(self) -> int:
+        """Total de valores guardados (mantido no cabecalho)."""
+        return self._total_chaves
+
+    def altura(self) -> int:
+        """Quantidade de paginas lidas da raiz ate uma folha."""
+        altura = 1
+        pagina = self._raiz
+        while True:
+            tipo, _, filhos, _ = self._ler_no(pagina)
+            if tipo == FOLHA:
+                return altura
+            pagina = filhos[0]
+            altura += 1
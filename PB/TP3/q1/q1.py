@@ -1,15 +1,25 @@
+import sys
 import time
 from collections import deque
 from pathlib import Path
 
+from indice_btree import BPlusTree
+
+# O indice em disco fica junto das demais saidas geradas, fora do codigo.
+CAMINHO_INDICE = Path("outputs") / "dados_tp1.idx"
+
 
 class Node:
     """Representa um unico registro dentro da arvore."""
 
+    __slots__ = ("valor", "esquerda", "direita", "tamanho")
+
     def __init__(self, valor: str):
         self.valor = valor
         self.esquerda = None
         self.direita = None
+        # Quantidade de nos na subarvore (o proprio no incluso), usada em rank/select.
+        self.tamanho = 1
 
 
 class BinaryTree:
@@ -26,6 +36,7 @@ class BinaryTree:
 
         atual = self.raiz
         while True:
+            atual.tamanho += 1
             if valor < atual.valor:
                 if atual.esquerda is None:
                     atual.esquerda = Node(valor)
@@ -44,6 +55,61 @@ class BinaryTree:
             self.inserir(valor)
         return time.perf_counter() - inicio
 
+    def construir_balanceada(self, valores, ordenados: bool = False) -> float:
+        """Substitui a arvore por uma perfeitamente balanceada e devolve o tempo total."""
+        inicio = time.perf_counter()
+        lista = list(valores) if ordenados else sorted(valores)
+        self.raiz = self._construir_intervalo(lista, 0, len(lista) - 1)
+        return time.perf_counter() - inicio
+
+    def _construir_intervalo(self, valores, inicio: int, fim: int):
+        """Usa o meio exato do intervalo como raiz, mesmo com nomes repetidos.
+
+        Copias iguais podem ficar dos dois lados; busca, rank e remocao ja tratam
+        isso, e a altura fica em log2(n) em vez de uma lista ligada de repetidos.
+        """
+        if inicio > fim:
+            return None
+        meio = (inicio + fim) // 2
+        no = Node(valores[meio])
+        no.esquerda = self._construir_intervalo(valores, inicio, meio - 1)
+        no.direita = self._construir_intervalo(valores, meio + 1, fim)
+        no.tamanho = fim - inicio + 1
+        return no
+
+    def rebalancear(self) -> float:
+        """Reconstroi a arvore atual a partir do percurso em ordem."""
+        inicio = time.perf_counter()
+        valores = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            atual = pilha.pop()
+            valores.append(atual.valor)
+            atual = atual.direita
+        self.raiz = self._construir_intervalo(valores, 0, len(valores) - 1)
+        return time.perf_counter() - inicio
+
+    def altura(self) -> int:
+        """Calcula a altura percorrendo a arvore nivel a nivel."""
+        if self.raiz is None:
+            return 0
+        nivel = [self.raiz]
+        altura = 0
+        while nivel:
+            altura += 1
+            proximo = []
+            for no in nivel:
+                if no.esquerda is not None:
+                    proximo.append(no.esquerda)
+                if no.direita is not None:
+                    proximo.append(no.direita)
+            nivel = proximo
+        return altura
+
     def buscar(self, valor: str):
         """Localiza um valor exato na arvore."""
         atual = self.raiz
@@ -57,26 +123,91 @@ class BinaryTree:
         return None
 
     def buscar_primeiro_por_prefixo(self, prefixo: str):
-        """Percorre a arvore em ordem e devolve o primeiro valor com o prefixo."""
+        """Desce ate o menor valor >= prefixo em O(h) e confere se ele tem o prefixo."""
+        candidato = None
+        atual = self.raiz
+        while atual is not None:
+            if atual.valor >= prefixo:
+                candidato = atual
+                atual = atual.esquerda
+            else:
+                atual = atual.direita
+        if candidato is not None and candidato.valor.startswith(prefixo):
+            return candidato.valor
+        return None
+
+    def iterar_por_prefixo(self, prefixo: str):
+        """Gera em ordem os valores com o prefixo, parando no primeiro que nao tiver."""
+        # A pilha comeca com os nos >= prefixo do caminho de busca (onde a descida
+        # virou a esquerda); dali segue o percurso em ordem normal.
         pilha = []
         atual = self.raiz
-        while pilha or atual is not None:
-            while atual is not None:
+        while atual is not None:
+            if atual.valor >= prefixo:
                 pilha.append(atual)
                 atual = atual.esquerda
+            else:
+                atual = atual.direita
+        while pilha:
             atual = pilha.pop()
-            if atual.valor.startswith(prefixo):
-                return atual.valor
+            if not atual.valor.startswith(prefixo):
+                return
+            yield atual.valor
             atual = atual.direita
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+
+    @staticmethod
+    def _tamanho(no) -> int:
+        return no.tamanho if no is not None else 0
+
+    def posicao(self, valor: str) -> int:
+        """Rank: quantos valores da arvore sao estritamente menores que `valor`, em O(h)."""
+        posicao = 0
+        atual = self.raiz
+        while atual is not None:
+            if atual.valor < valor:
+                posicao += 1 + self._tamanho(atual.esquerda)
+                atual = atual.direita
+            else:
+                atual = atual.esquerda
+        return posicao
+
+    def selecionar(self, k: int):
+        """Select: devolve o k-esimo menor valor (0-indexado) em O(h), ou None."""
+        if k < 0 or k >= self._tamanho(self.raiz):
+            return None
+        atual = self.raiz
+        while atual is not None:
+            tamanho_esquerda = self._tamanho(atual.esquerda)
+            if k < tamanho_esquerda:
+                atual = atual.esquerda
+            elif k == tamanho_esquerda:
+                return atual.valor
+            else:
+                k -= tamanho_esquerda + 1
+                atual = atual.direita
         return None
 
+    def contar_por_prefixo(self, prefixo: str) -> int:
+        """Conta os valores com o prefixo usando duas consultas de rank."""
+        if not prefixo:
+            return self._tamanho(self.raiz)
+        # Todo valor com o prefixo fica entre o prefixo e o prefixo com o ultimo
+        # caractere incrementado (ex.: "M" <= nome < "N").
+        limite = prefixo[:-1] + chr(ord(prefixo[-1]) + 1)
+        return self.posicao(limite) - self.posicao(prefixo)
+
     def remover(self, valor: str) -> bool:
         """Remove o valor indicado, se existir."""
         atual = self.raiz
         pai = None
+        caminho = []
 
         while atual is not None and atual.valor != valor:
             pai = atual
+            caminho.append(atual)
             if valor < atual.valor:
                 atual = atual.esquerda
             else:
@@ -85,10 +216,16 @@ class BinaryTree:
         if atual is None:
             return False
 
+        # So depois de confirmar a remocao os ancestrais perdem um no na subarvore.
+        for ancestral in caminho:
+            ancestral.tamanho -= 1
+
         if atual.esquerda is not None and atual.direita is not None:
+            atual.tamanho -= 1
             pai_sucessor = atual
             sucessor = atual.direita
             while sucessor.esquerda is not None:
+                sucessor.tamanho -= 1
                 pai_sucessor = sucessor
                 sucessor = sucessor.esquerda
             atual.valor = sucessor.valor
@@ -145,20 +282,8 @@ class BinaryTree:
             print(f"Nivel {nivel_atual}: {' '.join(linha)}")
 
     def contar_nos(self) -> int:
-        """Conta o total de nos presentes na arvore."""
-        if self.raiz is None:
-            return 0
-
-        pilha = [self.raiz]
-        quantidade = 0
-        while pilha:
-            no = pilha.pop()
-            quantidade += 1
-            if no.esquerda is not None:
-                pilha.append(no.esquerda)
-            if no.direita is not None:
-                pilha.append(no.direita)
-        return quantidade
+        """Devolve o total de nos, lido do tamanho guardado na raiz."""
+        return self._tamanho(self.raiz)
 
 
 def carregar_registros(caminho: Path):
@@ -183,14 +308,49 @@ def sugerir_melhor_raiz(registros):
     return ordenados[len(ordenados) // 2]
 
 
-def executar_menu(arvore: BinaryTree) -> None:
-    """Permite testar as operacoes manualmente depois da carga inicial."""
+def abrir_indice(caminho_dados: Path, registros, caminho_indice: Path = CAMINHO_INDICE):
+    """Abre o indice B+tree; reconstroi se ele nao existe ou foi montado de outros dados.
+
+    O cabecalho do indice guarda o mtime e o tamanho do arquivo de dados usado na
+    montagem, entao alteracoes feitas pelo menu no indice nao o deixam "mais novo"
+    que os dados. A reconstrucao usa os registros ja lidos de caminho_dados.
+    """
+    estado = caminho_dados.stat()
+    origem = (estado.st_mtime_ns, estado.st_size)
+    if caminho_indice.exists():
+        inicio = time.perf_counter()
+        try:
+            indice = BPlusTree(caminho_indice)
+        except ValueError:
+            indice = None
+        if indice is not None and indice.origem == origem:
+            print(f"Indice aberto em {time.perf_counter() - inicio:.6f} segundos: {caminho_indice}")
+            return indice
+        if indice is not None:
+            indice.fechar()
+
+    caminho_indice.parent.mkdir(parents=True, exist_ok=True)
+    caminho_indice.unlink(missing_ok=True)
+    indice = BPlusTree(caminho_indice)
+    tempo = indice.inserir_varios(registros)
+    indice.origem = origem
+    print(f"Indice reconstruido a partir de {caminho_dados} em {tempo:.6f} segundos")
+    return indice
+
+
+def executar_menu(arvore) -> None:
+    """Permite testar as operacoes manualmente depois da carga inicial.
+
+    Aceita a BinaryTree ou o indice BPlusTree, que tem os mesmos nomes de metodo.
+    """
     while True:
         print("\nMenu de operacoes:")
         print("1 - Inserir novo nome")
         print("2 - Remover primeiro nome com prefixo")
         print("3 - Buscar primeiro nome com prefixo")
         print("4 - Imprimir arvore ate altura 5")
+        print("5 - Contar nomes com prefixo")
+        print("6 - Buscar k-esimo nome em ordem")
         print("0 - Sair do menu")
         opcao = input("Opcao: ").strip()
 
@@ -225,25 +385,50 @@ def executar_menu(arvore: BinaryTree) -> None:
             else:
                 print("Nenhum nome encontrado com esse prefixo.")
         elif opcao == "4":
+            if not hasattr(arvore, "imprimir_ate_altura"):
+                print("Impressao por altura so existe na arvore em memoria.")
+                continue
             arvore.imprimir_ate_altura(altura_maxima=5)
+        elif opcao == "5":
+            prefixo = input("Prefixo a contar: ").strip()
+            print(f"Nomes com o prefixo '{prefixo}': {arvore.contar_por_prefixo(prefixo)}")
+        elif opcao == "6":
+            if not hasattr(arvore, "selecionar"):
+                print("Busca pela posicao so existe na arvore em memoria.")
+                continue
+            posicao = input("Posicao k (comecando em 1): ").strip()
+            if not posicao.isdigit() or int(posicao) < 1:
+                print("Posicao invalida.")
+                continue
+            nome = arvore.selecionar(int(posicao) - 1)
+            if nome is not None:
+                print(f"Nome na posicao {posicao}: {nome}")
+            else:
+                print("Posicao fora do total de nomes.")
         else:
             print("Opcao invalida.")
 
 
-def main() -> None:
-    """Carrega os dados, executa as operacoes pedidas e mostra os resultados."""
-    caminho_arquivo = Path("dados_tp1.txt")
-    registros = carregar_registros(caminho_arquivo)
-    if not registros:
-        print("Lista de registros vazia. Gere o arquivo antes de rodar a questao.")
-        return
-
+def analisar_arvore_em_memoria(registros) -> BinaryTree:
+    """Itens do enunciado que dependem da BinaryTree: insercao, altura, remocoes e raiz."""
     print(f"Total de registros carregados: {len(registros)}")
 
     arvore = BinaryTree()
     tempo_insercao = arvore.inserir_varios(registros)
     print(f"Tempo para inserir {len(registros)} nomes: {tempo_insercao:.6f} segundos")
     print(f"Total de nos apos a insercao: {arvore.contar_nos()}")
+    print(f"Altura apos insercoes uma a uma: {arvore.altura()}")
+
+    arvore_lote = BinaryTree()
+    tempo_lote = arvore_lote.construir_balanceada(registros)
+    print(
+        f"Tempo para montar a arvore balanceada em lote: {tempo_lote:.6f} segundos "
+        f"(altura {arvore_lote.altura()})"
+    )
+    arvore_ordenada = BinaryTree()
+    ordenados = sorted(registros)
+    tempo_ordenados = arvore_ordenada.construir_balanceada(ordenados, ordenados=True)
+    print(f"Tempo da carga em lote com entrada ja ordenada: {tempo_ordenados:.6f} segundos")
 
     removido, nome_removido = arvore.remover_primeiro_por_prefixo("M")
     if removido:
@@ -251,6 +436,9 @@ def main() -> None:
     else:
         print("Nenhum nome com prefixo 'M' foi encontrado para remocao.")
 
+    print(f"Nomes que comecam com 'M': {arvore.contar_por_prefixo('M')}")
+    print(f"Nome na posicao 5000 em ordem alfabetica: {arvore.selecionar(4999)}")
+
     encontrado = arvore.buscar_primeiro_por_prefixo("Z")
     if encontrado:
         print(f"Primeiro nome encontrado com prefixo 'Z': {encontrado}")
@@ -265,8 +453,34 @@ def main() -> None:
         print(f"\nSugestao de melhor raiz: {sugestao}")
     else:
         print("\nNao foi possivel sugerir uma raiz.")
+    return arvore
+
+
+def main() -> None:
+    """Roda os itens do enunciado na BinaryTree e as mesmas consultas no indice em disco.
+
+    O menu usa a BinaryTree; com `--indice` ele passa a operar no indice B+tree.
+    """
+    caminho_arquivo = Path("dados_tp1.txt")
+    usar_indice = "--indice" in sys.argv[1:]
+    registros = carregar_registros(caminho_arquivo)
+    if not registros:
+        print("Lista de registros vazia. Gere o arquivo antes de rodar a questao.")
+        return
+
+    arvore = analisar_arvore_em_memoria(registros)
+
+    print("\nConsultas no indice B+tree em disco:")
+    with abrir_indice(caminho_arquivo, registros) as indice:
+        print(f"Indice: {indice.contar_nos()} nomes, altura {indice.altura()} paginas")
+        print(f"Nomes que comecam com 'M': {indice.contar_por_prefixo('M')}")
+        encontrado = indice.buscar_primeiro_por_prefixo("Z")
+        if encontrado:
+            print(f"Primeiro nome encontrado com prefixo 'Z': {encontrado}")
+        else:
+            print("Nenhum nome com prefixo 'Z' foi encontrado.")
 
-    executar_menu(arvore)
+        executar_menu(indice if usar_indice else arvore)
 
 
 if __name__ == "__main__":
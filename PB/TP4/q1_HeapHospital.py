@@ -22,46 +22,44 @@ class BinaryHeap:
         # Retorna True se a heap não tem elementos
         return len(self.data) == 0
 
-    def _compare(self, a, b):
-        """Retorna True se 'a' deve vir antes de 'b' na heap (menor priority).
-
-        Critério:
-        - priority menor vem antes
-        """
-        return a['priority'] < b['priority']
-
-    def _swap(self, i, j):
-        # Troca dois elementos de posição
-        self.data[i], self.data[j] = self.data[j], self.data[i]
-
-    def _heapify_up(self, index):
-        # Sobe o elemento na posição 'index' até restaurar a propriedade da heap
-        while index > 0:
+    # Critério de ordem: priority menor vem antes. Os laços abaixo leem
+    # item['priority'] direto em variáveis locais em vez de chamar um método por
+    # comparação, e movem um "buraco" em vez de trocar pares a cada nível.
+
+    def _heapify_up(self, index, start=0):
+        # Sobe o elemento na posição 'index' (no máximo até 'start'): cada pai com
+        # priority maior desce uma posição e o elemento é gravado uma vez só no fim
+        data = self.data
+        item = data[index]
+        priority = item['priority']
+        while index > start:
             parent = (index - 1) // 2
-            if self._compare(self.data[index], self.data[parent]):
-                self._swap(index, parent)
+            parent_item = data[parent]
+            if priority < parent_item['priority']:
+                data[index] = parent_item
                 index = parent
             else:
                 break
+        data[index] = item
 
     def _heapify_down(self, index):
-        # Desce o elemento na posição 'index' até restaurar a propriedade da heap
-        n = len(self.data)
-        while True:
-            left = 2 * index + 1
-            right = 2 * index + 2
-            smallest = index
-
-            if left < n and self._compare(self.data[left], self.data[smallest]):
-                smallest = left
-            if right < n and self._compare(self.data[right], self.data[smallest]):
-                smallest = right
-
-            if smallest != index:
-                self._swap(index, smallest)
-                index = smallest
-            else:
-                break
+        # Descida de Floyd: leva o buraco até uma folha subindo sempre o menor filho
+        # (uma comparação por nível) e depois sobe o elemento a partir dali. O item
+        # que vem do fim da heap costuma ter priority alta, então a subida é curta
+        data = self.data
+        n = len(data)
+        start = index
+        item = data[index]
+        child = 2 * index + 1
+        while child < n:
+            right = child + 1
+            if right < n and data[right]['priority'] < data[child]['priority']:
+                child = right
+            data[index] = data[child]
+            index = child
+            child = 2 * index + 1
+        data[index] = item
+        self._heapify_up(index, start)
 
     def insert(self, item):
         """Insere um novo elemento (dict com name e priority) na heap."""